@@ -6,6 +6,11 @@ live here. Modules import from config instead of defining their own.
 
 Zen of Python: "There should be one -- and preferably only one -- obvious way to do it."
 """
+import math
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+
 from .schemas import SeverityLevel, SystemState
 
 
@@ -92,19 +97,101 @@ TRIAXIAL_PROXY = {
 }
 
 
+# ─── Bound Scalars ───────────────────────────────────────────
+# The dicts above stay as the readable source of truth; modules import
+# these names instead of indexing a dict per request.
+
+# Module F (Weibull)
+ALPHA_SEVERITY = WEIBULL_COEFFICIENTS["alpha_severity"]
+GAMMA_DEGRADATION = WEIBULL_COEFFICIENTS["gamma_degradation"]
+R_TARGET = WEIBULL_COEFFICIENTS["r_target"]
+
+# Module B++ (SEDL)
+W_SE = SEDL_WEIGHTS["SE"]
+W_TE = SEDL_WEIGHTS["TE"]
+W_DE = SEDL_WEIGHTS["DE"]
+
+# Module B+ trend classification / Module D escalation
+STEP_JUMP_THRESHOLD = SLOPE_THRESHOLDS["step_jump"]
+CHAOTIC_VOLATILITY_THRESHOLD = SLOPE_THRESHOLDS["chaotic_volatility"]
+CHAOTIC_SLOPE_MAX = SLOPE_THRESHOLDS["chaotic_slope_max"]
+ACCEL_SLOPE_THRESHOLD = SLOPE_THRESHOLDS["accel_slope"]
+ACCEL_CHANGE_THRESHOLD = SLOPE_THRESHOLDS["accel_change"]
+DRIFT_SLOPE_THRESHOLD = SLOPE_THRESHOLDS["drift_slope"]
+NLI_MULTIPLIER = SLOPE_THRESHOLDS["nli_multiplier"]
+SLOPE_ESCALATION_UNSTABLE = SLOPE_THRESHOLDS["escalation_unstable"]
+SLOPE_ESCALATION_DEGRADING = SLOPE_THRESHOLDS["escalation_degrading"]
+
+# Module E priority
+W_SEVERITY = PRIORITY_WEIGHTS["severity"]
+W_CONFIDENCE = PRIORITY_WEIGHTS["confidence"]
+W_CRITICALITY = PRIORITY_WEIGHTS["criticality"]
+W_URGENCY = PRIORITY_WEIGHTS["urgency"]
+SAFETY_MULTIPLIER = PRIORITY_MODIFIERS["safety_multiplier"]
+SPARES_PENALTY = PRIORITY_MODIFIERS["spares_penalty"]
+MANPOWER_PENALTY = PRIORITY_MODIFIERS["manpower_penalty"]
+PRIORITY_IMMEDIATE = PRIORITY_WINDOWS["immediate"]
+PRIORITY_24H = PRIORITY_WINDOWS["24h"]
+PRIORITY_7D = PRIORITY_WINDOWS["7d"]
+
+# Module A features (note: SLOPE_CHAOTIC_MAX is Module A's per-1000-sample
+# bound, distinct from Module B+'s CHAOTIC_SLOPE_MAX)
+SEVERITY_MULTIPLIER = FEATURE_THRESHOLDS["severity_multiplier"]
+BASELINE_RATIO_ALARM = FEATURE_THRESHOLDS["baseline_ratio_alarm"]
+BASELINE_RATIO_WARNING = FEATURE_THRESHOLDS["baseline_ratio_warning"]
+BASELINE_RATIO_WATCH = FEATURE_THRESHOLDS["baseline_ratio_watch"]
+VARIANCE_CHAOTIC_THRESHOLD = FEATURE_THRESHOLDS["variance_chaotic"]
+VARIANCE_PROCESS_THRESHOLD = FEATURE_THRESHOLDS["variance_process"]
+SLOPE_CHAOTIC_MAX = FEATURE_THRESHOLDS["slope_chaotic_max"]
+
+# Tri-axial proxy
+V_FROM_H = TRIAXIAL_PROXY["v_from_h"]
+A_FROM_H = TRIAXIAL_PROXY["a_from_h"]
+
 # ─── Classification Functions ────────────────────────────────
+# Lower bounds (excluding the first band) sorted ascending, with the
+# matching levels in parallel — derived from the dicts above so the
+# thresholds stay defined in one place. The level tuples hold the enum
+# members themselves, so classifying never goes through enum attribute lookup.
+_SEVERITY_BOUNDS = array("d", [low for low, _ in SEVERITY_THRESHOLDS.values()][1:])
+_SEVERITY_LEVELS = tuple(SEVERITY_THRESHOLDS)
+_SSI_BOUNDS = array("d", [low for low, _ in SSI_THRESHOLDS.values()][1:])
+_SSI_STATES = tuple(SSI_THRESHOLDS)
+
+
+# Scores are memoized at 1e-3 resolution. All bounds are multiples of
+# 1e-3, so flooring to that grid never moves a score across a band.
+_CLASSIFY_SCALE = 1000
+
+
+@lru_cache(maxsize=4096)
+def _classify_severity_q(q: int) -> SeverityLevel:
+    return _SEVERITY_LEVELS[bisect_right(_SEVERITY_BOUNDS, q / _CLASSIFY_SCALE)]
+
+
+@lru_cache(maxsize=4096)
+def _classify_ssi_q(q: int) -> SystemState:
+    return _SSI_STATES[bisect_right(_SSI_BOUNDS, q / _CLASSIFY_SCALE)]
+
 
 def classify_severity(score: float) -> SeverityLevel:
     """Classify a severity score into a SeverityLevel."""
-    for level, (low, high) in SEVERITY_THRESHOLDS.items():
-        if low <= score < high:
-            return level
-    return SeverityLevel.alarm
+    if not math.isfinite(score):
+        return _SEVERITY_LEVELS[bisect_right(_SEVERITY_BOUNDS, score)]
+    return _classify_severity_q(math.floor(score * _CLASSIFY_SCALE))
 
 
 def classify_ssi(ssi: float) -> SystemState:
     """Classify an SSI value into a SystemState."""
-    for state, (low, high) in SSI_THRESHOLDS.items():
-        if low <= ssi < high:
-            return state
-    return SystemState.critical
+    if not math.isfinite(ssi):
+        return _SSI_STATES[bisect_right(_SSI_BOUNDS, ssi)]
+    return _classify_ssi_q(math.floor(ssi * _CLASSIFY_SCALE))
+
+
+def clamp(value: float, upper: float = 1.0) -> float:
+    """``max(0.0, min(upper, value))`` as two comparisons, without the builtin calls.
+
+    Same result in every case, including NaN (→ ``upper``) and -0.0 (→ 0.0).
+    """
+    value = value if value < upper else upper
+    return value if value > 0.0 else 0.0
@@ -2,16 +2,19 @@
 RAPID AI Engine — FastAPI Application
 Full pipeline: Module 0 → A → B/B+/B++ (parallel) → C → D → E → F
 """
+import math
+import os
 import time
 import uuid
 import asyncio
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Optional, List, Dict
+from typing import Deque, Optional, List, Dict, Tuple
 
 import numpy as np
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .schemas import (
@@ -40,7 +43,7 @@ from .schemas import (
     SeverityLevel, HealthStage,
 )
 
-from .config import classify_severity, TRIAXIAL_PROXY
+from .config import classify_severity, V_FROM_H, A_FROM_H
 from .logging_config import configure_logging
 
 from .modules import (
@@ -53,15 +56,28 @@ from .modules import (
     moduleD_health,
     moduleE_maintenance,
     moduleF_rul,
+    signal_stats,
 )
 
-# Thread pool for running sync module code in parallel
-_executor = ThreadPoolExecutor(max_workers=4)
+# Thread pool for running sync module code in parallel. One worker per core
+# so the NumPy sections of B/B+/B++ (which release the GIL) can overlap.
+_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+
+def _warm_up() -> None:
+    """Pay first-call costs before the first request does.
+
+    Runs the shared stats kernel (loading NumPy's lazily imported
+    submodules) and the severity classifier once.
+    """
+    signal_stats([0.0, 1.0] * 128)
+    classify_severity(0.0)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     configure_logging(json_output=True)
+    _warm_up()
     yield
     _executor.shutdown(wait=False)
 
@@ -83,55 +99,91 @@ app.add_middleware(
 
 # ─── Triaxial Helpers ─────────────────────────────────────────
 
+# Below this length a plain Python sum beats building an ndarray
+_RMS_NUMPY_MIN_LEN = 1024
+
+
+def _rms(values: List[float]) -> float:
+    """Root-mean-square of a non-empty sequence."""
+    n = len(values)
+    if n < _RMS_NUMPY_MIN_LEN:
+        return math.sqrt(sum(v * v for v in values) / n)
+    arr = np.asarray(values, dtype=np.float64)
+    return math.sqrt(float(arr @ arr) / n)
+
+
+def _signals_by_direction(
+    additional_signals: Optional[List[SignalInput]],
+) -> Dict[str, List[float]]:
+    """Map direction -> values for the non-empty additional signals (last one wins)."""
+    return {
+        sig.direction.value: sig.values
+        for sig in (additional_signals or ())
+        if sig.values
+    }
+
+
 def _extract_triaxial_metrics(
     h_rms: float,
-    additional_signals: Optional[List[SignalInput]],
+    signals: Dict[str, List[float]],
 ) -> Dict[str, float]:
     """Compute H/V/A RMS values from real signals when available, else proxy."""
-    result = {"H": h_rms}
-    v_vals = None
-    a_vals = None
-
-    if additional_signals:
-        for sig in additional_signals:
-            direction = sig.direction.value.upper()
-            if direction == "V" and sig.values:
-                v_vals = sig.values
-            elif direction == "A" and sig.values:
-                a_vals = sig.values
-
-    if v_vals is not None:
-        arr = np.array(v_vals)
-        result["V"] = float(np.sqrt(np.mean(arr**2)))
-    else:
-        result["V"] = h_rms * TRIAXIAL_PROXY["v_from_h"]
+    v_vals = signals.get("V")
+    a_vals = signals.get("A")
+    return {
+        "H": h_rms,
+        "V": _rms(v_vals) if v_vals is not None else h_rms * V_FROM_H,
+        "A": _rms(a_vals) if a_vals is not None else h_rms * A_FROM_H,
+    }
 
-    if a_vals is not None:
-        arr = np.array(a_vals)
-        result["A"] = float(np.sqrt(np.mean(arr**2)))
-    else:
-        result["A"] = h_rms * TRIAXIAL_PROXY["a_from_h"]
 
-    return result
+# Module B++ works on the leading window of each channel
+SPECTRUM_WINDOW = 256
+
+
+def _spectrum_window(values: List[float]) -> List[float]:
+    """Leading SPECTRUM_WINDOW samples; short inputs are passed through uncopied."""
+    return values[:SPECTRUM_WINDOW] if len(values) > SPECTRUM_WINDOW else values
 
 
 def _extract_triaxial_spectra(
     h_values: List[float],
-    additional_signals: Optional[List[SignalInput]],
+    signals: Dict[str, List[float]],
 ) -> Dict[str, List[float]]:
     """Extract raw spectra for H/V/A channels for Module B++."""
-    spectra: Dict[str, List[float]] = {
-        "H": h_values[:256] if len(h_values) >= 256 else h_values,
-        "V": [],
-        "A": [],
+    v_vals = signals.get("V")
+    a_vals = signals.get("A")
+    return {
+        "H": _spectrum_window(h_values),
+        "V": _spectrum_window(v_vals) if v_vals is not None else [],
+        "A": _spectrum_window(a_vals) if a_vals is not None else [],
     }
-    if additional_signals:
-        for sig in additional_signals:
-            direction = sig.direction.value.upper()
-            if direction in ("V", "A") and sig.values:
-                vals = sig.values[:256] if len(sig.values) >= 256 else sig.values
-                spectra[direction] = vals
-    return spectra
+
+
+# Not config.clamp: that one keeps the NaN -> upper result of the
+# max(0.0, min(upper, x)) form it replaced, while C_final has always
+# counted a NaN confidence as 0.0 (the min(1.0, max(0.0, x)) order).
+def _clamp01(x: float) -> float:
+    """Clamp to [0, 1]; NaN maps to 0.0, as with ``min(1.0, max(0.0, x))``."""
+    return 1.0 if x > 1.0 else x if x > 0.0 else 0.0
+
+
+# Trace IDs are served from a pool refilled with a single urandom call
+_TRACE_ID_BATCH = 128
+_trace_id_pool: Deque[str] = deque()
+
+
+def _next_trace_id() -> str:
+    """Return a random (RFC 4122 version 4) UUID string from the pool."""
+    try:
+        return _trace_id_pool.popleft()
+    except IndexError:
+        raw = os.urandom(16 * _TRACE_ID_BATCH)
+        _trace_id_pool.extend(
+            str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+            for i in range(0, len(raw), 16)
+        )
+        return _trace_id_pool.popleft()
 
 
 def _extract_temperature(context: Optional[ContextInput]) -> float:
@@ -267,8 +319,24 @@ def run_moduleF(request: ModuleFRequest):
 
 # ─── Full Pipeline Orchestrator ───────────────────────────────
 
-@app.post("/rapid-ai/evaluate", response_model=FullAnalysisResponse)
-async def evaluate(request: FullAnalysisRequest):
+def _guard_and_trend(
+    m0_req: Module0Request,
+    mA_req: ModuleARequest,
+) -> Tuple[Module0Response, Optional[ModuleAResponse]]:
+    """Run Module 0, then Module A on its signal statistics unless it blocks."""
+    m0_resp, stats = module0_dataguard.run_with_stats(m0_req)
+    if m0_resp.block:
+        return m0_resp, None
+    return m0_resp, moduleA_trend.run(mA_req, stats)
+
+
+def _json_response(model: FullAnalysisResponse) -> Response:
+    """Serialize straight to JSON bytes via Pydantic, bypassing response_model re-validation."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+@app.post("/rapid-ai/evaluate", responses={200: {"model": FullAnalysisResponse}})
+async def evaluate(request: FullAnalysisRequest) -> Response:
     """
     Run the entire RAPID AI pipeline:
     Module 0 → A → (B ∥ B+ ∥ B++) → C → D → E → F
@@ -276,8 +344,8 @@ async def evaluate(request: FullAnalysisRequest):
     B, B+, B++ run in parallel.
     If Module 0 blocks, pipeline aborts early.
     """
-    t0 = time.perf_counter()
-    trace_id = request.trace_id or str(uuid.uuid4())
+    t0 = time.perf_counter_ns()
+    trace_id = request.trace_id or _next_trace_id()
 
     # ── Input validation ──
     if request.failure_threshold <= 0:
@@ -288,10 +356,12 @@ async def evaluate(request: FullAnalysisRequest):
         raise HTTPException(status_code=400, detail="criticality must be between 0 and 1")
 
     trace = ModuleTrace()
-    loop = asyncio.get_event_loop()
+
+    # Sub-requests below are assembled from fields FastAPI has already
+    # validated (or from module outputs), so they skip re-validation.
 
     # ────── Module 0: Data Guard ──────
-    m0_req = Module0Request(
+    m0_req = Module0Request.model_construct(
         schema_version=request.schema_version,
         trace_id=trace_id,
         asset_id=request.asset_id,
@@ -299,13 +369,32 @@ async def evaluate(request: FullAnalysisRequest):
         signal=request.signal,
         context=request.context,
     )
-    m0_resp = await loop.run_in_executor(_executor, module0_dataguard.run, m0_req)
+
+    # ────── Module A: Trend Engine ──────
+    mA_req = ModuleARequest.model_construct(
+        asset_id=request.asset_id,
+        machine_type=request.machine_type,
+        signal_type=request.signal.signal_type,
+        direction=request.signal.direction,
+        sampling_rate_hz=request.signal.sampling_rate_hz,
+        values=request.signal.values,
+        baseline=None,
+        context=request.context,
+    )
+
+    # Both stages are NumPy passes over the raw waveform, so they run on the
+    # executor rather than holding the event loop; Module A reuses Module 0's
+    # signal statistics and is skipped when Module 0 blocks.
+    loop = asyncio.get_running_loop()
+    m0_resp, mA_resp = await loop.run_in_executor(
+        _executor, _guard_and_trend, m0_req, mA_req
+    )
     trace.module0 = m0_resp
 
     if m0_resp.block:
         # Pipeline aborted — data quality insufficient
-        elapsed = (time.perf_counter() - t0) * 1000
-        return FullAnalysisResponse(
+        elapsed = (time.perf_counter_ns() - t0) / 1_000_000
+        return _json_response(FullAnalysisResponse.model_construct(
             schema_version=request.schema_version,
             trace_id=trace_id,
             asset_id=request.asset_id,
@@ -317,28 +406,16 @@ async def evaluate(request: FullAnalysisRequest):
             recommended_window="N/A",
             module_trace=trace,
             execution_time_ms=round(elapsed, 2),
-        )
+        ))
 
     quality = m0_resp.quality_score
-
-    # ────── Module A: Trend Engine ──────
-    mA_req = ModuleARequest(
-        asset_id=request.asset_id,
-        machine_type=request.machine_type,
-        signal_type=request.signal.signal_type,
-        direction=request.signal.direction,
-        sampling_rate_hz=request.signal.sampling_rate_hz,
-        values=request.signal.values,
-        baseline=None,
-        context=request.context,
-    )
-    mA_resp = await loop.run_in_executor(_executor, moduleA_trend.run, mA_req)
     trace.moduleA = mA_resp
 
     # ────── B / B+ / B++ in Parallel ──────
     # Module B request — use real triaxial data when available
-    triaxial = _extract_triaxial_metrics(mA_resp.overall_rms, request.additional_signals)
-    mB_req = ModuleBRequest(
+    signals = _signals_by_direction(request.additional_signals)
+    triaxial = _extract_triaxial_metrics(mA_resp.overall_rms, signals)
+    mB_req = ModuleBRequest.model_construct(
         asset_id=request.asset_id,
         component=request.component,
         metrics={
@@ -352,19 +429,20 @@ async def evaluate(request: FullAnalysisRequest):
     # Module B+ request (needs historical data)
     hist_ts = request.historical_timestamps or []
     hist_vals = request.historical_values or []
-    mBp_req = ModuleBPlusRequest(
+    mBp_req = ModuleBPlusRequest.model_construct(
         asset_id=request.asset_id,
         timestamps=hist_ts,
         values=hist_vals,
     )
 
     # Module B++ request (needs spectra — derive from signal)
-    mBpp_req = ModuleBPPRequest(
+    mBpp_req = ModuleBPPRequest.model_construct(
         asset_id=request.asset_id,
-        spectra=_extract_triaxial_spectra(request.signal.values, request.additional_signals),
+        spectra=_extract_triaxial_spectra(request.signal.values, signals),
     )
 
-    # Run in parallel
+    # Run in parallel; the sequential C/D/E/F stages after it are cheap
+    # scalar code and are called inline.
     mB_future = loop.run_in_executor(_executor, moduleB_initiators.run, mB_req)
     mBp_future = loop.run_in_executor(_executor, moduleBplus_slope.run, mBp_req)
     mBpp_future = loop.run_in_executor(_executor, moduleBpp_sedl.run, mBpp_req)
@@ -383,27 +461,27 @@ async def evaluate(request: FullAnalysisRequest):
     bp_severity = mBp_resp.severity_score
     bpp_si = mBpp_resp.SI
 
-    block_input = BlockInput(
+    block_input = BlockInput.model_construct(
         B_match_score=b_match,
         Bplus_trend_class=bp_trend,
         Bplus_confidence=bp_severity,
         process_correlation=0.0,
     )
 
-    mC_req = ModuleCRequest(
+    mC_req = ModuleCRequest.model_construct(
         system_type=request.system_type,
         blocks={request.component: block_input},
         stability_state=mBpp_resp.stability_state,
     )
-    mC_resp = await loop.run_in_executor(_executor, moduleC_fusion.run, mC_req)
+    mC_resp = moduleC_fusion.run(mC_req)
     trace.moduleC = mC_resp
 
     # ────── Module D: Health Stage ──────
-    mD_req = ModuleDRequest(
+    mD_req = ModuleDRequest.model_construct(
         SSI=mC_resp.SSI,
         SSI_slope=mBp_resp.slope,
     )
-    mD_resp = await loop.run_in_executor(_executor, moduleD_health.run, mD_req)
+    mD_resp = moduleD_health.run(mD_req)
     trace.moduleD = mD_resp
 
     # ────── Effective Severity & Confidence ──────
@@ -412,10 +490,11 @@ async def evaluate(request: FullAnalysisRequest):
     s_eff = s_fusion * quality
 
     # C_final = Q_data × (1 − ∏(1 − C_i))
-    c_values = [bp_severity, bpp_si, b_match]
-    prod_1_minus = 1.0
-    for c in c_values:
-        prod_1_minus *= (1.0 - min(1.0, max(0.0, c)))
+    prod_1_minus = (
+        (1.0 - _clamp01(bp_severity))
+        * (1.0 - _clamp01(bpp_si))
+        * (1.0 - _clamp01(b_match))
+    )
     c_final = quality * (1.0 - prod_1_minus)
 
     # ────── Module E: Maintenance Plan ──────
@@ -423,7 +502,7 @@ async def evaluate(request: FullAnalysisRequest):
     if mB_resp.matched_rules:
         diagnosis = mB_resp.matched_rules[0].diagnosis
 
-    mE_req = ModuleERequest(
+    mE_req = ModuleERequest.model_construct(
         asset_id=request.asset_id,
         severity_score=s_eff,
         confidence=c_final,
@@ -433,11 +512,11 @@ async def evaluate(request: FullAnalysisRequest):
         diagnosis=diagnosis,
         component=request.component,
     )
-    mE_resp = await loop.run_in_executor(_executor, moduleE_maintenance.run, mE_req)
+    mE_resp = moduleE_maintenance.run(mE_req)
     trace.moduleE = mE_resp
 
     # ────── Module F: RUL & Probability ──────
-    mF_req = ModuleFRequest(
+    mF_req = ModuleFRequest.model_construct(
         asset_id=request.asset_id,
         severity_score=s_eff,
         confidence=c_final,
@@ -450,7 +529,7 @@ async def evaluate(request: FullAnalysisRequest):
         component_type=request.component,
         SSI=mC_resp.SSI,
     )
-    mF_resp = await loop.run_in_executor(_executor, moduleF_rul.run, mF_req)
+    mF_resp = moduleF_rul.run(mF_req)
     trace.moduleF = mF_resp
 
     # ────── Final severity level ──────
@@ -475,8 +554,8 @@ async def evaluate(request: FullAnalysisRequest):
         rec_window=mF_resp.recommended_window,
     )
 
-    elapsed = (time.perf_counter() - t0) * 1000
-    return FullAnalysisResponse(
+    elapsed = (time.perf_counter_ns() - t0) / 1_000_000
+    return _json_response(FullAnalysisResponse.model_construct(
         schema_version=request.schema_version,
         trace_id=trace_id,
         asset_id=request.asset_id,
@@ -492,4 +571,4 @@ async def evaluate(request: FullAnalysisRequest):
         report=report,
         module_trace=trace,
         execution_time_ms=round(elapsed, 2),
-    )
+    ))
@@ -10,3 +10,4 @@ from . import (
     moduleE_maintenance,
     moduleF_rul,
 )
+from ._stats import SignalStats, signal_stats, signal_stats_batch
@@ -0,0 +1,179 @@
+"""
+Shared signal statistics.
+Module 0 and Module A both describe the same raw waveform; computing the
+NaN-free array and its moments here lets Module 0 do it once per /evaluate
+call and the orchestrator hand the result on to Module A.
+"""
+import math
+import numpy as np
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+
+class SignalStats(NamedTuple):
+    n: int              # raw sample count, NaNs included
+    clean: np.ndarray   # NaN-free float64 samples
+    mean: float = 0.0
+    std: float = 0.0    # sample std (ddof=1)
+    rms: float = 0.0
+    peak: float = 0.0   # max |x|
+    kurtosis: float = 0.0  # excess
+    vmin: float = 0.0
+    vmax: float = 0.0
+    slope: float = 0.0  # least-squares slope per sample
+
+
+def as_float64(values: Sequence[float]) -> np.ndarray:
+    """Float64 view of ``values``; arrays pass through, lists are filled directly.
+
+    ``np.fromiter`` with a known count writes into a preallocated buffer and
+    skips the shape/dtype discovery ``np.asarray`` does on a list.
+    """
+    if isinstance(values, np.ndarray):
+        return np.asarray(values, dtype=np.float64)
+    return np.fromiter(values, dtype=np.float64, count=len(values))
+
+
+# Longest index vector kept in the cache (512 KiB of float64)
+CENTRED_INDEX_CACHE_MAX = 65536
+
+
+def centred_index(n: int) -> np.ndarray:
+    """Sample index shifted to zero mean: i − (n − 1)/2.
+
+    Acquisition sizes repeat, so vectors up to CENTRED_INDEX_CACHE_MAX are
+    built once per length and shared (read-only) across requests. Longer
+    lengths are client-controlled and unbounded, so they are built per call
+    rather than pinned in the cache.
+    """
+    if n <= CENTRED_INDEX_CACHE_MAX:
+        return _cached_centred_index(n)
+    return _build_centred_index(n)
+
+
+def _build_centred_index(n: int) -> np.ndarray:
+    x = np.arange(n, dtype=float)
+    x -= (n - 1) / 2.0
+    x.flags.writeable = False
+    return x
+
+
+_cached_centred_index = lru_cache(maxsize=32)(_build_centred_index)
+
+
+def linear_slope(y: np.ndarray) -> float:
+    """Least-squares slope of y against its sample index.
+
+    Closed form with a centred index: Σ(x − x̄)·y / Σ(x − x̄)², where the
+    denominator is n(n² − 1)/12 — no Vandermonde matrix or SVD.
+    """
+    n = len(y)
+    return float(centred_index(n) @ y) / (n * (n * n - 1) / 12.0)
+
+
+def signal_stats(values: List[float]) -> SignalStats:
+    """Compute the superset of statistics used by Modules 0 and A (slope included).
+
+    Each statistic is one reduction over ``clean``; the centred samples are
+    computed once and shared by std and kurtosis (via Σd² and Σd⁴). Fewer than two clean
+    samples leave every moment at zero.
+    """
+    arr = as_float64(values)
+    # The sum is NaN iff a NaN is present (or ±inf cancel), so it doubles as
+    # the NaN probe: well-behaved signals never build a mask or copy.
+    total = float(arr.sum())
+    if math.isnan(total):
+        clean = arr[~np.isnan(arr)]
+        total = float(clean.sum())
+    else:
+        clean = arr
+    m = len(clean)
+
+    if m < 2:
+        return SignalStats(n=len(arr), clean=clean)
+
+    mean = total / m
+    vmax = float(clean.max())
+    vmin = float(clean.min())
+    rms = math.sqrt(float(clean @ clean) / m)
+
+    centred = clean - mean
+    std = math.sqrt(float(centred @ centred) / (m - 1))
+    if std > 1e-12:
+        # Square in place: Σd⁴ is then a dot product, with no further temporaries.
+        np.multiply(centred, centred, out=centred)
+        kurt = float(centred @ centred) / m / std ** 4 - 3.0
+    else:
+        kurt = 0.0
+
+    return SignalStats(
+        n=len(arr),
+        clean=clean,
+        mean=mean,
+        std=std,
+        rms=rms,
+        peak=max(vmax, -vmin),
+        kurtosis=kurt,
+        vmin=vmin,
+        vmax=vmax,
+        slope=linear_slope(clean),
+    )
+
+
+def signal_stats_batch(batch: Sequence[List[float]]) -> List[SignalStats]:
+    """:func:`signal_stats` for many signals, in input order.
+
+    Signals are grouped by length and each group is stacked into an (N, L)
+    array so every reduction is a single axis=1 call. Singletons, signals
+    shorter than two samples and rows containing NaN take the scalar path.
+    """
+    out: List[Optional[SignalStats]] = [None] * len(batch)
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i, values in enumerate(batch):
+        groups[len(values)].append(i)
+
+    for length, idx in groups.items():
+        if length < 2 or len(idx) == 1:
+            for i in idx:
+                out[i] = signal_stats(batch[i])
+            continue
+
+        arr2d = np.asarray([batch[i] for i in idx], dtype=np.float64)
+        has_nan = np.isnan(arr2d).any(axis=1)
+        for i, bad in zip(idx, has_nan):
+            if bad:
+                out[i] = signal_stats(batch[i])
+        rows = arr2d[~has_nan]
+        ids = [i for i, bad in zip(idx, has_nan) if not bad]
+        if not ids:
+            continue
+
+        mean = rows.sum(axis=1) / length
+        vmax = rows.max(axis=1)
+        vmin = rows.min(axis=1)
+        rms = np.sqrt(np.einsum("ij,ij->i", rows, rows) / length)
+
+        centred = rows - mean[:, None]
+        std = np.sqrt(np.einsum("ij,ij->i", centred, centred) / (length - 1))
+        flat = std <= 1e-12
+        np.multiply(centred, centred, out=centred)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kurt = np.einsum("ij,ij->i", centred, centred) / length / std ** 4 - 3.0
+        kurt[flat] = 0.0
+        slope = (rows @ centred_index(length)) / (length * (length * length - 1) / 12.0)
+
+        for k, i in enumerate(ids):
+            out[i] = SignalStats(
+                n=length,
+                clean=rows[k],
+                mean=float(mean[k]),
+                std=float(std[k]),
+                rms=float(rms[k]),
+                peak=max(float(vmax[k]), -float(vmin[k])),
+                kurtosis=float(kurt[k]),
+                vmin=float(vmin[k]),
+                vmax=float(vmax[k]),
+                slope=float(slope[k]),
+            )
+    return out
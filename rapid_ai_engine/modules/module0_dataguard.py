@@ -6,74 +6,105 @@ Quality score = product of all triggered penalties, clamped [0, 1].
 import math
 import time
 import numpy as np
-from typing import List, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 
 from ..schemas import (
     Module0Request, Module0Response, DataGuardFlags,
-    SignalMetrics, StatusLevel
+    SignalMetrics, SignalType, StatusLevel
 )
+from ..config import clamp
+from ._stats import SignalStats, signal_stats, signal_stats_batch
 
 # ─── Allowed unit sets per signal type ───
 ALLOWED_UNITS = {
-    "velocity": {"mm/s", "inch/s", "in/s"},
-    "acceleration": {"g", "m/s²", "m/s2"},
-    "displacement": {"µm", "um", "mm", "mil"},
+    SignalType.velocity: frozenset({"mm/s", "inch/s", "in/s"}),
+    SignalType.acceleration: frozenset({"g", "m/s²", "m/s2"}),
+    SignalType.displacement: frozenset({"µm", "um", "mm", "mil"}),
 }
 
 # Allowed sampling rates per signal type
+_STANDARD_FS = frozenset({256, 512, 1024, 2048, 2560, 5120, 6400, 10240, 25600, 51200})
 ALLOWED_FS = {
-    "velocity": {256, 512, 1024, 2048, 2560, 5120, 6400, 10240, 25600, 51200},
-    "acceleration": {256, 512, 1024, 2048, 2560, 5120, 6400, 10240, 25600, 51200},
-    "displacement": {256, 512, 1024, 2048, 2560, 5120, 6400},
+    SignalType.velocity: _STANDARD_FS,
+    SignalType.acceleration: _STANDARD_FS,
+    SignalType.displacement: frozenset({256, 512, 1024, 2048, 2560, 5120, 6400}),
 }
 
+_EMPTY: frozenset = frozenset()
 
-def _compute_metrics(values: List[float]) -> SignalMetrics:
-    """Compute basic signal statistics."""
-    arr = np.array(values, dtype=float)
-    n = len(arr)
-    nan_mask = np.isnan(arr)
-    nan_frac = float(nan_mask.sum() / n) if n > 0 else 0.0
-    clean = arr[~nan_mask]
 
-    if len(clean) < 2:
-        return SignalMetrics(sample_count=n, nan_fraction=nan_frac)
+class _SignalSpec(NamedTuple):
+    units: frozenset
+    sampling_rates: frozenset
 
-    mean = float(np.mean(clean))
-    std = float(np.std(clean, ddof=1))
-    rms = float(np.sqrt(np.mean(clean ** 2)))
-    peak = float(np.max(np.abs(clean)))
-    cf = peak / rms if rms > 1e-12 else 0.0
 
-    # Kurtosis (excess)
-    if std > 1e-12:
-        kurt = float(np.mean(((clean - mean) / std) ** 4)) - 3.0
-    else:
-        kurt = 0.0
+# One lookup per request resolves everything type-specific.
+_SPECS = {
+    st: _SignalSpec(ALLOWED_UNITS.get(st, _EMPTY), ALLOWED_FS.get(st, _EMPTY))
+    for st in SignalType
+}
+_NO_SPEC = _SignalSpec(_EMPTY, _EMPTY)
+
+
+def _compute_metrics(values: List[float],
+                     stats: Optional[SignalStats] = None) -> Tuple[SignalMetrics, np.ndarray]:
+    """Compute basic signal statistics.
+
+    The NaN-free array is returned alongside the metrics so the soft checks
+    can reuse it. Pass ``stats`` when the caller already has them.
+    """
+    if stats is None:
+        stats = signal_stats(values)
+    n = stats.n
+    clean = stats.clean
+    m = len(clean)
+    nan_frac = float((n - m) / n) if n > 0 else 0.0
+
+    if m < 2:
+        return SignalMetrics(sample_count=n, nan_fraction=nan_frac), clean
+
+    rms = stats.rms
+    cf = stats.peak / rms if rms > 1e-12 else 0.0
 
     # Clip fraction — values at sensor extremes
-    if len(clean) > 10:
-        max_val = np.max(clean)
-        min_val = np.min(clean)
-        clip_count = np.sum((clean >= 0.999 * max_val) | (clean <= 0.999 * min_val))
-        clip_frac = float(clip_count / len(clean))
+    if m > 10:
+        # The two tails only overlap for a constant signal, where every sample
+        # is in both; otherwise the counts simply add.
+        if stats.vmax == stats.vmin:
+            clip_count = m
+        else:
+            clip_count = (np.count_nonzero(clean >= 0.999 * stats.vmax)
+                          + np.count_nonzero(clean <= 0.999 * stats.vmin))
+        clip_frac = float(clip_count / m)
     else:
         clip_frac = 0.0
 
     return SignalMetrics(
         sample_count=n,
         nan_fraction=nan_frac,
-        std_dev=round(std, 6),
+        std_dev=round(stats.std, 6),
         rms=round(rms, 6),
-        peak=round(peak, 6),
+        peak=round(stats.peak, 6),
         crest_factor=round(cf, 4),
-        kurtosis=round(kurt, 4),
+        kurtosis=round(stats.kurtosis, 4),
         clip_fraction=round(clip_frac, 6),
-    )
+    ), clean
 
 
-def run(request: Module0Request) -> Module0Response:
-    """Execute all data guard checks and return quality score."""
+def run(request: Module0Request, stats: Optional[SignalStats] = None) -> Module0Response:
+    """Execute all data guard checks and return quality score.
+
+    ``stats`` may carry precomputed :func:`signal_stats` for ``request.signal.values``.
+    """
+    return run_with_stats(request, stats)[0]
+
+
+def run_with_stats(request: Module0Request,
+                   stats: Optional[SignalStats] = None) -> Tuple[Module0Response, SignalStats]:
+    """Like :func:`run`, but also return the signal statistics it used.
+
+    The orchestrator hands them on to Module A instead of recomputing them.
+    """
     t0 = time.perf_counter()
     flags = DataGuardFlags()
     reasons: List[str] = []
@@ -82,6 +113,7 @@ def run(request: Module0Request) -> Module0Response:
 
     sig = request.signal
     values = sig.values
+    spec = _SPECS.get(sig.signal_type, _NO_SPEC)
 
     # ── DG_001: Required fields presence ──
     if not request.asset_id or not request.timestamp_utc:
@@ -95,15 +127,18 @@ def run(request: Module0Request) -> Module0Response:
         reasons.append(f"DG_002: Too few samples ({len(values)} < 256)")
 
     # ── DG_005: Unit mismatch ──
-    allowed = ALLOWED_UNITS.get(sig.signal_type.value, set())
-    if sig.unit not in allowed:
+    if sig.unit not in spec.units:
         blocked = True
         flags.unit_mismatch = True
         reasons.append(f"DG_005: Unit '{sig.unit}' not valid for {sig.signal_type.value}")
 
+    # Blocked responses report measured metrics too, so every path needs the stats
+    if stats is None:
+        stats = signal_stats(values)
+
     if blocked:
         elapsed = (time.perf_counter() - t0) * 1000
-        metrics = _compute_metrics(values) if len(values) >= 2 else SignalMetrics()
+        metrics = _compute_metrics(values, stats)[0] if len(values) >= 2 else SignalMetrics()
         return Module0Response(
             trace_id=request.trace_id,
             status=StatusLevel.block,
@@ -114,11 +149,10 @@ def run(request: Module0Request) -> Module0Response:
             metrics=metrics,
             confidence_modifier=0.0,
             execution_time_ms=round(elapsed, 2),
-        )
+        ), stats
 
     # Compute metrics for soft checks
-    metrics = _compute_metrics(values)
-    arr = np.array(values, dtype=float)
+    metrics, clean = _compute_metrics(values, stats)
 
     # ── DG_003: NaN fraction ──
     if metrics.nan_fraction > 0.01:
@@ -133,14 +167,12 @@ def run(request: Module0Request) -> Module0Response:
         reasons.append(f"DG_004: Clipping fraction {metrics.clip_fraction:.3f} > 0.01")
 
     # ── DG_006: Sampling rate suspect ──
-    allowed_fs = ALLOWED_FS.get(sig.signal_type.value, set())
-    if sig.sampling_rate_hz not in allowed_fs:
+    if sig.sampling_rate_hz not in spec.sampling_rates:
         flags.sampling_rate_suspect = True
         penalties.append(0.7)
         reasons.append(f"DG_006: Sampling rate {sig.sampling_rate_hz} Hz suspect")
 
     # ── DG_007: Flatline ──
-    clean = arr[~np.isnan(arr)]
     if len(clean) > 10:
         detrended_std = float(np.std(np.diff(clean)))
         if detrended_std < 1e-6:
@@ -150,8 +182,11 @@ def run(request: Module0Request) -> Module0Response:
 
     # ── DG_009: Outlier burst ──
     if len(clean) > 30 and metrics.std_dev > 1e-6:
-        z_scores = np.abs((clean - np.mean(clean)) / metrics.std_dev)
-        outlier_frac = float(np.sum(z_scores > 3.0) / len(clean))
+        # |x − mean| > 3σ, compared in place instead of materialising z-scores
+        deviation = clean - np.mean(clean)
+        np.abs(deviation, out=deviation)
+        outliers = np.count_nonzero(deviation > 3.0 * metrics.std_dev)
+        outlier_frac = float(outliers / len(clean))
         if outlier_frac > 0.02:
             flags.outlier_burst = True
             penalties.append(0.9)
@@ -174,10 +209,7 @@ def run(request: Module0Request) -> Module0Response:
         reasons.append("DG_016: Magnet mount may slip at high RMS")
 
     # ── Compute quality score ──
-    quality_score = 1.0
-    for p in penalties:
-        quality_score *= p
-    quality_score = max(0.0, min(1.0, quality_score))
+    quality_score = clamp(math.prod(penalties, start=1.0))
 
     # Determine status
     if quality_score >= 0.8:
@@ -198,4 +230,10 @@ def run(request: Module0Request) -> Module0Response:
         metrics=metrics,
         confidence_modifier=round(quality_score, 4),
         execution_time_ms=round(elapsed, 2),
-    )
+    ), stats
+
+
+def run_batch(requests: List[Module0Request]) -> List[Module0Response]:
+    """Run many requests, computing signal statistics for equal-length signals together."""
+    stats = signal_stats_batch([r.signal.values for r in requests])
+    return [run(r, s) for r, s in zip(requests, stats)]
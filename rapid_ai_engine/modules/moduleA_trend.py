@@ -12,44 +12,53 @@ from typing import List, Optional
 from ..schemas import (
     ModuleARequest, ModuleAResponse, SeverityLevel
 )
+from ._stats import SignalStats, signal_stats, signal_stats_batch
+
+# ─── Module A Constants (from shared config) ─────────────────────
+from ..config import (
+    classify_severity,
+    SEVERITY_MULTIPLIER,
+    BASELINE_RATIO_ALARM, BASELINE_RATIO_WARNING, BASELINE_RATIO_WATCH,
+    VARIANCE_CHAOTIC_THRESHOLD, VARIANCE_PROCESS_THRESHOLD, SLOPE_CHAOTIC_MAX,
+)
 
-# ─── Module A Constants ──────────────────────────────────────────
-SEVERITY_MULTIPLIER = 10.0
-BASELINE_RATIO_ALARM = 2.0
-BASELINE_RATIO_WARNING = 1.5
-BASELINE_RATIO_WATCH = 1.2
-VARIANCE_CHAOTIC_THRESHOLD = 60.0
-VARIANCE_PROCESS_THRESHOLD = 40.0
-SLOPE_CHAOTIC_MAX = 0.05
+log = structlog.get_logger(__name__)
 
 
 def _logistic(x: float) -> float:
-    """Sigmoid / logistic function clamped to avoid overflow."""
+    """Sigmoid / logistic function, clamped to [-20, 20].
+
+    Uses the identity σ(x) = ½(1 + tanh(x/2)): one transcendental, no division.
+    """
     x = max(-20.0, min(20.0, x))
-    return 1.0 / (1.0 + math.exp(-x))
+    return 0.5 * (1.0 + math.tanh(0.5 * x))
+
+
+def _logistic_array(x: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`_logistic` for batched scoring."""
+    x = np.clip(x, -20.0, 20.0)
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
 
 
-def run(request: ModuleARequest) -> ModuleAResponse:
+def run(request: ModuleARequest, stats: Optional[SignalStats] = None) -> ModuleAResponse:
+    """Score trend severity; ``stats`` may carry precomputed :func:`signal_stats`."""
     t0 = time.perf_counter()
     try:
-        arr = np.array(request.values, dtype=float)
-        clean = arr[~np.isnan(arr)]
+        if stats is None:
+            stats = signal_stats(request.values)
+        clean = stats.clean
 
         if len(clean) < 2:
             return ModuleAResponse(execution_time_ms=round((time.perf_counter() - t0) * 1000, 2))
 
         # ── Core signal statistics ──
-        rms = float(np.sqrt(np.mean(clean ** 2)))
-        peak = float(np.max(np.abs(clean)))
-        mean = float(np.mean(clean))
-        std = float(np.std(clean, ddof=1))
+        rms = stats.rms
+        peak = stats.peak
+        mean = stats.mean
+        std = stats.std
+        kurt = stats.kurtosis
         cf = peak / rms if rms > 1e-12 else 0.0
 
-        if std > 1e-12:
-            kurt = float(np.mean(((clean - mean) / std) ** 4)) - 3.0
-        else:
-            kurt = 0.0
-
         # ── Baseline comparison ──
         baseline = request.baseline
         ratio = None
@@ -63,8 +72,7 @@ def run(request: ModuleARequest) -> ModuleAResponse:
         # Approximate slope from values if we have enough
         slope = 0.0
         if len(clean) >= 4:
-            x = np.arange(len(clean), dtype=float)
-            raw_slope = float(np.polyfit(x, clean, 1)[0])
+            raw_slope = stats.slope
             # Normalize: slope per sample → slope per 1000 samples
             slope = raw_slope * min(len(clean), 1000)
 
@@ -97,14 +105,7 @@ def run(request: ModuleARequest) -> ModuleAResponse:
             classification = "process"
 
         # ── Severity level ──
-        if severity_score >= 0.8:
-            level = SeverityLevel.alarm
-        elif severity_score >= 0.5:
-            level = SeverityLevel.warning
-        elif severity_score >= 0.3:
-            level = SeverityLevel.watch
-        else:
-            level = SeverityLevel.normal
+        level = classify_severity(severity_score)
 
         elapsed = (time.perf_counter() - t0) * 1000
         return ModuleAResponse(
@@ -122,10 +123,16 @@ def run(request: ModuleARequest) -> ModuleAResponse:
         )
     except Exception as e:
         elapsed = (time.perf_counter() - t0) * 1000
-        structlog.get_logger(__name__).error("module_error", module="A", error=str(e), exc_info=True)
+        log.error("module_error", module="A", error=str(e), exc_info=True)
         return ModuleAResponse(
             execution_time_ms=round(elapsed, 2),
             severity_score=0.0,
             severity_level=SeverityLevel.normal,
             trend_classification="error",
         )
+
+
+def run_batch(requests: List[ModuleARequest]) -> List[ModuleAResponse]:
+    """Run many requests, computing signal statistics for equal-length signals together."""
+    stats = signal_stats_batch([r.values for r in requests])
+    return [run(r, s) for r, s in zip(requests, stats)]
@@ -5,9 +5,11 @@ across 12 component types (AFB, JB, TPJB, couplings, motors, etc.).
 
 Each rule uses AND logic on directional ratios + supplementary metrics.
 """
+import operator
 import time
 import structlog
-from typing import Dict, List, Any, Optional
+import numpy as np
+from typing import Dict, List, Any, Callable, NamedTuple, Optional, Tuple
 from ..schemas import ModuleBRequest, ModuleBResponse, MatchedRule
 
 
@@ -395,79 +397,284 @@ RULES_DB["chains"] = _build_chain_rules()
 RULES_DB["shafts"] = _build_shaft_rules()
 
 
-def _compute_derived(metrics: Dict[str, float]) -> Dict[str, float]:
-    """Add derived ratio metrics."""
-    m = dict(metrics)
-    H = m.get("H", 0.001)
-    V = m.get("V", 0.001)
-    A = m.get("A", 0.001)
+# ─── Fixed metric layout ─────────────────────────────────────────
+# Derived metrics live in a flat list; rule conditions carry list indices.
+_RATIO_KEYS = ("H_V_ratio", "V_H_ratio", "A_H_ratio", "A_V_ratio", "V_A_ratio")
+_RAW_KEYS = ("H", "V", "A") + tuple(sorted(
+    {cond[0] for rules in RULES_DB.values() for rule in rules
+     for cond in (*rule["conditions"], *rule.get("or_conditions", ()))}
+    - {"H", "V", "A", *_RATIO_KEYS}
+))
+_METRICS = _RAW_KEYS + _RATIO_KEYS
+_METRIC_INDEX = {key: i for i, key in enumerate(_METRICS)}
+
+# Comparison operators as integer opcodes, resolved once when rules compile
+_OP_CODES = {">=": 0, "<=": 1, ">": 2, "<": 3, "==": 4}
+_OP_SYMBOLS = tuple(_OP_CODES)
+_OPS = (
+    operator.ge,
+    operator.le,
+    operator.gt,
+    operator.lt,
+    lambda value, threshold: abs(value - threshold) < 1e-9,
+)
+
+# (metric index, opcode, threshold)
+_Condition = Tuple[int, int, float]
+# (comparison function, metric index, threshold) — the form ``run`` evaluates,
+# with the opcode already resolved to its function
+_Check = Tuple[Callable[[float, float], bool], int, float]
+
+
+class _CompiledRule(NamedTuple):
+    rule_id: str
+    initiator: str
+    diagnosis: str
+    score: float
+    conditions: Tuple[_Condition, ...]
+    or_conditions: Tuple[_Condition, ...]
+    checks: Tuple[_Check, ...]     # ``conditions`` in evaluation form
+    or_checks: Tuple[_Check, ...]  # ``or_conditions`` in evaluation form
+
+
+def _compile_conditions(conditions: List[tuple]) -> Tuple[_Condition, ...]:
+    return tuple((_METRIC_INDEX[metric_key], _OP_CODES[op], thresh)
+                 for metric_key, op, thresh in conditions)
+
+
+def _checks(conditions: Tuple[_Condition, ...]) -> Tuple[_Check, ...]:
+    return tuple((_OPS[op], idx, thresh) for idx, op, thresh in conditions)
+
+
+def _compile_rules(rules: List[dict]) -> Tuple[_CompiledRule, ...]:
+    """Flatten rule dicts into tuples so ``run`` does no per-rule dict lookups."""
+    compiled = []
+    for rule in rules:
+        conditions = _compile_conditions(rule["conditions"])
+        or_conditions = _compile_conditions(rule.get("or_conditions", ()))
+        compiled.append(_CompiledRule(
+            rule_id=rule["rule_id"],
+            initiator=rule["initiator"],
+            diagnosis=rule["diagnosis"],
+            score=rule["severity_base"],
+            conditions=conditions,
+            or_conditions=or_conditions,
+            checks=_checks(conditions),
+            or_checks=_checks(or_conditions),
+        ))
+    return tuple(compiled)
+
+
+# Rules in evaluation form, keyed like RULES_DB (which stays the editable source)
+_COMPILED: Dict[str, Tuple[_CompiledRule, ...]] = {
+    component: _compile_rules(rules) for component, rules in RULES_DB.items()
+}
+
+
+class _RuleGroup(NamedTuple):
+    gate: Optional[_Check]  # shared AND condition; None = always scan
+    rules: Tuple[Tuple[int, _CompiledRule], ...]  # (position in component, rule)
+
+
+def _group_by_gate(rules: Tuple[_CompiledRule, ...]) -> Tuple[_RuleGroup, ...]:
+    """One-level discrimination tree over a component's rules.
+
+    Each AND-only rule is filed under its most widely shared condition, so a
+    request tests that condition once and skips every rule behind it when it
+    fails. Rules with OR branches can match without their AND part and are
+    never gated.
+    """
+    counts: Dict[_Condition, int] = {}
+    for rule in rules:
+        for cond in set(rule.conditions):
+            counts[cond] = counts.get(cond, 0) + 1
+
+    groups: Dict[Optional[_Condition], List[Tuple[int, _CompiledRule]]] = {}
+    for pos, rule in enumerate(rules):
+        gate = None
+        if rule.conditions and not rule.or_conditions:
+            gate = max(rule.conditions, key=counts.__getitem__)
+        groups.setdefault(gate, []).append((pos, rule))
+    return tuple(
+        _RuleGroup(None if gate is None else _checks((gate,))[0], tuple(members))
+        for gate, members in groups.items()
+    )
+
+
+_DISPATCH: Dict[str, Tuple[_RuleGroup, ...]] = {
+    component: _group_by_gate(rules) for component, rules in _COMPILED.items()
+}
+
+# Rules by descending severity (table order among equals), for confidence_only
+_BY_SCORE: Dict[str, Tuple[Tuple[int, _CompiledRule], ...]] = {
+    component: tuple(sorted(enumerate(rules), key=lambda item: -item[1].score))
+    for component, rules in _COMPILED.items()
+}
+
+
+class _RuleArrays(NamedTuple):
+    """A component's conditions as padded (rules × slots) arrays for run_batch."""
+    metric_idx: np.ndarray  # intp
+    op: np.ndarray          # int8 opcode
+    threshold: np.ndarray   # float64
+    valid: np.ndarray       # bool — slot holds a real condition
+    or_metric_idx: np.ndarray
+    or_op: np.ndarray
+    or_threshold: np.ndarray
+    or_valid: np.ndarray
+
+
+def _pad_conditions(condition_sets: List[Tuple[_Condition, ...]]):
+    width = max((len(c) for c in condition_sets), default=0) or 1
+    shape = (len(condition_sets), width)
+    metric_idx = np.zeros(shape, dtype=np.intp)
+    op = np.zeros(shape, dtype=np.int8)
+    threshold = np.zeros(shape, dtype=np.float64)
+    valid = np.zeros(shape, dtype=bool)
+    for r, conditions in enumerate(condition_sets):
+        for c, (idx, code, thresh) in enumerate(conditions):
+            metric_idx[r, c], op[r, c], threshold[r, c], valid[r, c] = idx, code, thresh, True
+    return metric_idx, op, threshold, valid
+
+
+def _rule_arrays(rules: Tuple[_CompiledRule, ...]) -> _RuleArrays:
+    return _RuleArrays(
+        *_pad_conditions([rule.conditions for rule in rules]),
+        *_pad_conditions([rule.or_conditions for rule in rules]),
+    )
+
+
+_ARRAYS: Dict[str, _RuleArrays] = {
+    component: _rule_arrays(rules) for component, rules in _COMPILED.items()
+}
+
+# Vectorised counterparts of _OPS, indexed by the same opcodes
+_UFUNCS = (
+    np.greater_equal,
+    np.less_equal,
+    np.greater,
+    np.less,
+    lambda value, threshold: np.abs(value - threshold) < 1e-9,
+)
+
+
+def _eval_slots(vals: np.ndarray, metric_idx: np.ndarray, op: np.ndarray,
+                threshold: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Truth of every (request, rule, slot) condition; padding slots are False."""
+    lhs = vals[:, metric_idx]  # (B, R, C)
+    ok = np.zeros(lhs.shape, dtype=bool)
+    for code, ufunc in enumerate(_UFUNCS):
+        sel = op == code
+        if sel.any():
+            ok |= sel & ufunc(lhs, threshold)
+    return ok & valid
+
+
+def _compute_derived(metrics: Dict[str, float]) -> List[float]:
+    """Raw and derived ratio metrics, positioned by ``_METRIC_INDEX``."""
+    get = metrics.get
+    H = get("H", 0.001)
+    V = get("V", 0.001)
+    A = get("A", 0.001)
     eps = 1e-9
-    m["H_V_ratio"] = H / max(V, eps)
-    m["V_H_ratio"] = V / max(H, eps)
-    m["A_H_ratio"] = A / max(H, eps)
-    m["A_V_ratio"] = A / max(V, eps)
-    m["V_A_ratio"] = V / max(A, eps)
-    return m
-
-
-def _eval_condition(value: float, op: str, threshold: float) -> bool:
-    if op == ">=":
-        return value >= threshold
-    elif op == "<=":
-        return value <= threshold
-    elif op == ">":
-        return value > threshold
-    elif op == "<":
-        return value < threshold
-    elif op == "==":
-        return abs(value - threshold) < 1e-9
-    return False
-
-
-def run(request: ModuleBRequest) -> ModuleBResponse:
+    derived = [get(key, 0.0) for key in _RAW_KEYS]
+    # Clamped denominators, written as max(x, eps) without the builtin call
+    # (a NaN still passes through, as it does with max)
+    h = eps if H < eps else H
+    v = eps if V < eps else V
+    a = eps if A < eps else A
+    derived += (
+        H / v,  # H_V_ratio
+        V / h,  # V_H_ratio
+        A / h,  # A_H_ratio
+        A / v,  # A_V_ratio
+        V / a,  # V_A_ratio
+    )
+    return derived
+
+
+def _resolve_component(component: str) -> str:
+    # Callers almost always send the canonical lowercase key; only fold
+    # case when the exact lookup misses.
+    return component if component in _DISPATCH else component.lower()
+
+
+def _matched(rule: _CompiledRule, conditions: Tuple[_Condition, ...],
+             derived: List[float]) -> MatchedRule:
+    return MatchedRule(
+        rule_id=rule.rule_id,
+        initiator=rule.initiator,
+        diagnosis=rule.diagnosis,
+        score=rule.score,
+        triggered_conditions=[
+            {"expr": _METRICS[idx], "op": _OP_SYMBOLS[op],
+             "threshold": thresh, "value": round(derived[idx], 4)}
+            for idx, op, thresh in conditions
+        ],
+    )
+
+
+def _top_hit(component: str, derived: List[float]) -> List[Tuple[int, MatchedRule]]:
+    """The highest-severity match only.
+
+    Rules are scanned by descending severity, so the first one that fires
+    fixes the confidence and the rest of the table is never evaluated.
+    """
+    for pos, rule in _BY_SCORE.get(component, ()):
+        for compare, idx, thresh in rule.checks:
+            if not compare(derived[idx], thresh):
+                break
+        else:
+            if rule.conditions:
+                return [(pos, _matched(rule, rule.conditions, derived))]
+            continue
+        for k, (compare, idx, thresh) in enumerate(rule.or_checks):
+            if compare(derived[idx], thresh):
+                return [(pos, _matched(rule, (rule.or_conditions[k],), derived))]
+    return []
+
+
+def run(request: ModuleBRequest, confidence_only: bool = False) -> ModuleBResponse:
+    """Evaluate the component's rules against the request metrics.
+
+    ``confidence_only`` reports just the highest-severity match, which is
+    all a caller reading ``confidence`` needs. It is an internal option, not
+    part of the request contract.
+    """
     t0 = time.perf_counter()
     try:
-        component = request.component.lower()
-        rules = RULES_DB.get(component, [])
+        component = _resolve_component(request.component)
+        groups = _DISPATCH.get(component, ())
         derived = _compute_derived(request.metrics)
 
-        matched: List[MatchedRule] = []
-
-        for rule in rules:
-            conditions = rule["conditions"]
-            or_conditions = rule.get("or_conditions", [])
-            all_met = True
-            triggered = []
-
-            for (metric_key, op, thresh) in conditions:
-                val = derived.get(metric_key, 0.0)
-                if _eval_condition(val, op, thresh):
-                    triggered.append({
-                        "expr": metric_key, "op": op,
-                        "threshold": thresh, "value": round(val, 4)
-                    })
+        hits: List[Tuple[int, MatchedRule]] = []
+        if confidence_only:
+            hits = _top_hit(component, derived)
+            groups = ()
+
+        for gate, members in groups:
+            if gate is not None and not gate[0](derived[gate[1]], gate[2]):
+                continue
+            for pos, rule in members:
+                # Decide the match first; triggered details are only built
+                # for rules that actually fire.
+                for compare, idx, thresh in rule.checks:
+                    if not compare(derived[idx], thresh):
+                        break
                 else:
-                    all_met = False
-                    break
-
-            # Check OR conditions if AND conditions didn't match
-            if not all_met and or_conditions:
-                for (metric_key, op, thresh) in or_conditions:
-                    val = derived.get(metric_key, 0.0)
-                    if _eval_condition(val, op, thresh):
-                        all_met = True
-                        triggered = [{"expr": metric_key, "op": op,
-                                      "threshold": thresh, "value": round(val, 4)}]
+                    if rule.conditions:
+                        hits.append((pos, _matched(rule, rule.conditions, derived)))
+                    continue
+
+                # Check OR conditions if AND conditions didn't match
+                for k, (compare, idx, thresh) in enumerate(rule.or_checks):
+                    if compare(derived[idx], thresh):
+                        hits.append((pos, _matched(rule, (rule.or_conditions[k],), derived)))
                         break
 
-            if all_met and triggered:
-                matched.append(MatchedRule(
-                    rule_id=rule["rule_id"],
-                    initiator=rule["initiator"],
-                    diagnosis=rule["diagnosis"],
-                    score=rule["severity_base"],
-                    triggered_conditions=triggered,
-                ))
+        # Groups interleave rules; report matches in rule-table order
+        hits.sort(key=operator.itemgetter(0))
+        matched = [m for _, m in hits]
 
         # Confidence = highest matched rule severity
         confidence = max((m.score for m in matched), default=0.0)
@@ -489,3 +696,68 @@ def run(request: ModuleBRequest) -> ModuleBResponse:
             num_matches=0,
             confidence=0.0,
         )
+
+
+def run_batch(requests: List[ModuleBRequest],
+              confidence_only: bool = False) -> List[ModuleBResponse]:
+    """Evaluate many requests, one vectorised pass per component.
+
+    Requests are grouped by component and their derived metrics stacked into
+    a (B, metrics) matrix, so each condition slot of every rule is tested for
+    the whole group with a handful of NumPy ops. ``MatchedRule`` objects are
+    only built for the matches. ``execution_time_ms`` is the batch time
+    amortised over its requests.
+    """
+    t0 = time.perf_counter()
+    try:
+        responses: List[Optional[ModuleBResponse]] = [None] * len(requests)
+        groups: Dict[str, List[int]] = {}
+        for i, request in enumerate(requests):
+            groups.setdefault(_resolve_component(request.component), []).append(i)
+
+        for component, idx in groups.items():
+            rules = _COMPILED.get(component, ())
+            derived_rows = [_compute_derived(requests[i].metrics) for i in idx]
+            per_request: List[List[MatchedRule]] = [[] for _ in idx]
+
+            if rules:
+                arrays = _ARRAYS[component]
+                vals = np.array(derived_rows, dtype=np.float64)
+                and_ok = _eval_slots(vals, arrays.metric_idx, arrays.op,
+                                     arrays.threshold, arrays.valid)
+                has_and = arrays.valid.any(axis=1)
+                and_ok = (and_ok | ~arrays.valid).all(axis=2) & has_and
+                or_ok = _eval_slots(vals, arrays.or_metric_idx, arrays.or_op,
+                                    arrays.or_threshold, arrays.or_valid)
+                first_or = or_ok.argmax(axis=2)
+                # As in run(): a rule without AND conditions never matches
+                or_hit = or_ok.any(axis=2) & has_and
+
+                for b, r in zip(*np.nonzero(and_ok | or_hit)):
+                    rule = rules[r]
+                    if and_ok[b, r]:
+                        conditions = rule.conditions
+                    else:
+                        conditions = (rule.or_conditions[first_or[b, r]],)
+                    per_request[b].append(_matched(rule, conditions, derived_rows[b]))
+
+            for b, i in enumerate(idx):
+                matched = per_request[b]
+                confidence = max((m.score for m in matched), default=0.0)
+                if matched and confidence_only:
+                    # max() keeps the first of equals, as run()'s severity scan does
+                    matched = [max(matched, key=lambda m: m.score)]
+                responses[i] = ModuleBResponse(
+                    component=component,
+                    num_matches=len(matched),
+                    matched_rules=matched,
+                    confidence=round(confidence, 4),
+                )
+
+        elapsed = (time.perf_counter() - t0) * 1000 / max(len(requests), 1)
+        for response in responses:
+            response.execution_time_ms = round(elapsed, 2)
+        return responses
+    except Exception:
+        # Fall back to per-request evaluation, which logs and isolates failures
+        return [run(request, confidence_only) for request in requests]
@@ -10,22 +10,34 @@ import numpy as np
 from typing import List
 
 from ..schemas import ModuleBPlusRequest, ModuleBPlusResponse, TrendClass
+from ._stats import centred_index, linear_slope
 
-# ─── Module B+ Constants ─────────────────────────────────────────
-STEP_JUMP_THRESHOLD = 0.5
-CHAOTIC_VOLATILITY_THRESHOLD = 0.3
-CHAOTIC_SLOPE_MAX = 0.02
-ACCEL_SLOPE_THRESHOLD = 0.05
-ACCEL_CHANGE_THRESHOLD = 0.02
-DRIFT_SLOPE_THRESHOLD = 0.02
-NLI_MULTIPLIER = 5.0
+# ─── Module B+ Constants (from shared config) ────────────────────
+from ..config import (
+    STEP_JUMP_THRESHOLD, CHAOTIC_VOLATILITY_THRESHOLD, CHAOTIC_SLOPE_MAX,
+    ACCEL_SLOPE_THRESHOLD, ACCEL_CHANGE_THRESHOLD, DRIFT_SLOPE_THRESHOLD,
+    NLI_MULTIPLIER,
+)
+
+# Trend class by condition bits (step, chaotic, accelerating, drift) = (8, 4, 2, 1);
+# the highest set bit wins, giving Step > Chaotic > Accelerating > Drift > Stable.
+_TREND_TABLE = tuple(
+    TrendClass.Step if flags & 8 else
+    TrendClass.Chaotic if flags & 4 else
+    TrendClass.Accelerating if flags & 2 else
+    TrendClass.Drift if flags & 1 else
+    TrendClass.Stable
+    for flags in range(16)
+)
 
 
 def run(request: ModuleBPlusRequest) -> ModuleBPlusResponse:
     t0 = time.perf_counter()
     try:
-        values = np.array(request.values, dtype=float)
-        n = len(values)
+        # Preallocated fill from the list (or any sized iterable, e.g. an
+        # ndarray handed over via model_construct); always a private buffer.
+        n = len(request.values)
+        values = np.fromiter(request.values, dtype=np.float64, count=n)
 
         if n < 2:
             return ModuleBPlusResponse(
@@ -33,30 +45,30 @@ def run(request: ModuleBPlusRequest) -> ModuleBPlusResponse:
             )
 
         # ── Log-domain transform (protect against zero/negatives) ──
+        # In place: ``values`` is already a private copy of the request data
         eps = 1e-9
-        log_vals = np.log(np.maximum(values, eps))
+        log_vals = np.log(np.maximum(values, eps, out=values), out=values)
 
         # ── Slope via least-squares regression ──
-        x = np.arange(n, dtype=float)
-        if n >= 2:
-            coeffs = np.polyfit(x, log_vals, 1)
-            slope = float(coeffs[0])  # slope per sample step
-        else:
-            slope = 0.0
+        # Closed form against a centred index (see _stats.linear_slope)
+        xc = centred_index(n)
+        slope = float(xc @ log_vals) / (n * (n * n - 1) / 12.0)  # slope per sample step
 
         # ── Slope change (second derivative) ──
         slope_change = 0.0
         if n >= 4:
             mid = n // 2
             if mid >= 2 and (n - mid) >= 2:
-                slope1 = float(np.polyfit(np.arange(mid), log_vals[:mid], 1)[0])
-                slope2 = float(np.polyfit(np.arange(n - mid), log_vals[mid:], 1)[0])
+                slope1 = linear_slope(log_vals[:mid])
+                slope2 = linear_slope(log_vals[mid:])
                 slope_change = slope2 - slope1
 
         # ── Instability index (NLI proxy) ──
-        # Variance-based instability measure
+        # Variance-based instability measure; the fitted line passes through
+        # (x̄, ȳ), so residuals come straight from the global fit.
         if n >= 3:
-            residuals = log_vals - np.polyval(np.polyfit(x, log_vals, 1), x)
+            residuals = log_vals - float(log_vals.sum()) / n
+            residuals -= slope * xc
             volatility = float(np.std(residuals))
         else:
             volatility = 0.0
@@ -69,21 +81,17 @@ def run(request: ModuleBPlusRequest) -> ModuleBPlusResponse:
         abs_change = abs(slope_change)
 
         # Step detection: large jump between consecutive points
-        max_jump = 0.0
-        if n >= 2:
-            diffs = np.abs(np.diff(log_vals))
-            max_jump = float(np.max(diffs))
-
-        if max_jump > STEP_JUMP_THRESHOLD:
-            trend_class = TrendClass.Step
-        elif volatility > CHAOTIC_VOLATILITY_THRESHOLD and abs_slope < CHAOTIC_SLOPE_MAX:
-            trend_class = TrendClass.Chaotic
-        elif abs_slope > ACCEL_SLOPE_THRESHOLD and abs_change > ACCEL_CHANGE_THRESHOLD:
-            trend_class = TrendClass.Accelerating
-        elif abs_slope > DRIFT_SLOPE_THRESHOLD:
-            trend_class = TrendClass.Drift
-        else:
-            trend_class = TrendClass.Stable
+        # max |Δ| from the extremes of Δ — two reductions, no abs() temporary
+        diffs = np.diff(log_vals)
+        max_jump = max(float(diffs.max()), -float(diffs.min()))
+
+        flags = (
+            (max_jump > STEP_JUMP_THRESHOLD) << 3
+            | (volatility > CHAOTIC_VOLATILITY_THRESHOLD and abs_slope < CHAOTIC_SLOPE_MAX) << 2
+            | (abs_slope > ACCEL_SLOPE_THRESHOLD and abs_change > ACCEL_CHANGE_THRESHOLD) << 1
+            | (abs_slope > DRIFT_SLOPE_THRESHOLD)
+        )
+        trend_class = _TREND_TABLE[flags]
 
         # ── Severity score ──
         if trend_class == TrendClass.Chaotic:
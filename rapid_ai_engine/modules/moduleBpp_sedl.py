@@ -9,17 +9,18 @@ import time
 import math
 import structlog
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..schemas import (
     ModuleBPPRequest, ModuleBPPResponse,
     StabilityState, SeverityLevel
 )
 
-# Frozen weights (WCFG01)
-W_SE = 0.5
-W_TE = 0.3
-W_DE = 0.2
+# Frozen weights (WCFG01) — from shared config
+from ..config import W_SE, W_TE, W_DE, clamp
+
+# Maximum entropy of the H/V/A split
+_LOG3 = math.log(3)
 
 
 def _shannon_entropy(probs: np.ndarray) -> float:
@@ -28,7 +29,8 @@ def _shannon_entropy(probs: np.ndarray) -> float:
     if len(probs) < 2:
         return 0.0
     n = len(probs)
-    h = -float(np.sum(probs * np.log(probs)))
+    # Σp·log p as one dot product: no p·log p temporary to sum afterwards
+    h = -float(probs @ np.log(probs))
     h_max = math.log(n)
     return h / h_max if h_max > 0 else 0.0
 
@@ -40,16 +42,40 @@ def _spectral_entropy(values: np.ndarray) -> float:
     fft_mag = np.abs(np.fft.rfft(values))[1:]  # drop DC
     if fft_mag.sum() < 1e-12:
         return 0.0
-    probs = (fft_mag ** 2) / np.sum(fft_mag ** 2)
+    # Power spectrum normalised in place — the magnitudes are not needed again
+    probs = np.square(fft_mag, out=fft_mag)
+    probs /= probs.sum()
     return _shannon_entropy(probs)
 
 
+def _uniform_histogram(values: np.ndarray, n_bins: int) -> np.ndarray:
+    """Counts identical to ``np.histogram(values, bins=n_bins)[0]``.
+
+    Equal-width bins over [min, max] are indexed arithmetically and counted
+    with ``np.bincount``; samples on a bin edge are nudged exactly as NumPy
+    does. Skips np.histogram's argument handling, which dominates at
+    vibration-window sizes.
+    """
+    lo = float(values.min())
+    hi = float(values.max())
+    if not (math.isfinite(lo) and math.isfinite(hi)):
+        raise ValueError(f"autodetected range of [{lo}, {hi}] is not finite")
+    if lo == hi:
+        lo -= 0.5
+        hi += 0.5
+    edges = np.linspace(lo, hi, n_bins + 1)
+    idx = ((values - lo) * (n_bins / (hi - lo))).astype(np.intp)
+    idx[idx == n_bins] -= 1
+    idx[values < edges[idx]] -= 1
+    idx[(values >= edges[idx + 1]) & (idx != n_bins - 1)] += 1
+    return np.bincount(idx, minlength=n_bins)
+
+
 def _time_entropy(values: np.ndarray, n_bins: int = 50) -> float:
     """Compute time-domain entropy from histogram of signal values."""
     if len(values) < 10:
         return 0.0
-    hist, _ = np.histogram(values, bins=n_bins, density=False)
-    hist = hist.astype(float)
+    hist = _uniform_histogram(values, n_bins).astype(float)
     total = hist.sum()
     if total < 1:
         return 0.0
@@ -63,58 +89,67 @@ def _directional_entropy(energies: Dict[str, float]) -> float:
     total = sum(vals)
     if total < 1e-12:
         return 0.0
-    probs = np.array([v / total for v in vals])
-    # Normalized by log(3) for 3 directions
-    probs = probs[probs > 0]
+    # Three values: plain floats beat NumPy's per-call overhead
+    probs = [p for p in (v / total for v in vals) if p > 0]
     if len(probs) < 2:
         return 0.0
-    h = -float(np.sum(probs * np.log(probs)))
-    return h / math.log(3)
+    h = -sum(p * math.log(p) for p in probs)
+    # Normalized by log(3) for 3 directions
+    return h / _LOG3
+
+
+def _entropies_from_spectra(spectra: Dict[str, List[float]]) -> Tuple[float, float, float]:
+    """SE, TE and DE computed from raw H/V/A spectra."""
+    SE = 0.0
+    TE = 0.0
+    h_vals = np.array(spectra.get("H", []), dtype=float)
+    v_vals = np.array(spectra.get("V", []), dtype=float)
+    a_vals = np.array(spectra.get("A", []), dtype=float)
+
+    # Spectral entropy (use H as primary)
+    if len(h_vals) > 4:
+        SE = _spectral_entropy(h_vals)
+    if len(v_vals) > 4:
+        se_v = _spectral_entropy(v_vals)
+        SE = max(SE, se_v)  # worst case
+
+    # Time entropy (use H)
+    if len(h_vals) > 10:
+        TE = _time_entropy(h_vals)
+
+    # Directional entropy — channel energies as dot products (Σx², no x² temporary)
+    energies = {
+        "H": float(h_vals @ h_vals),
+        "V": float(v_vals @ v_vals),
+        "A": float(a_vals @ a_vals),
+    }
+    DE = _directional_entropy(energies)
+    return SE, TE, DE
 
 
 def run(request: ModuleBPPRequest) -> ModuleBPPResponse:
     t0 = time.perf_counter()
     try:
-        SE = 0.0
-        TE = 0.0
-        DE = 0.0
-        dSE_dt = 0.0
-
         # ── Option A: Pre-computed metrics provided ──
+        # The edge-device path: plain float lookups, no array work.
         if request.metrics:
-            SE = request.metrics.get("SE", 0.0)
-            TE = request.metrics.get("TE", 0.0)
-            DE = request.metrics.get("DE", 0.0)
-            dSE_dt = request.metrics.get("dSE_dt", 0.0)
+            get = request.metrics.get
+            SE = get("SE", 0.0)
+            TE = get("TE", 0.0)
+            DE = get("DE", 0.0)
+            dSE_dt = get("dSE_dt", 0.0)
 
         # ── Option B: Compute from raw spectra ──
         elif request.spectra:
-            h_vals = np.array(request.spectra.get("H", []), dtype=float)
-            v_vals = np.array(request.spectra.get("V", []), dtype=float)
-            a_vals = np.array(request.spectra.get("A", []), dtype=float)
-
-            # Spectral entropy (use H as primary)
-            if len(h_vals) > 4:
-                SE = _spectral_entropy(h_vals)
-            if len(v_vals) > 4:
-                se_v = _spectral_entropy(v_vals)
-                SE = max(SE, se_v)  # worst case
-
-            # Time entropy (use H)
-            if len(h_vals) > 10:
-                TE = _time_entropy(h_vals)
-
-            # Directional entropy
-            energies = {
-                "H": float(np.sum(h_vals ** 2)) if len(h_vals) > 0 else 0.0,
-                "V": float(np.sum(v_vals ** 2)) if len(v_vals) > 0 else 0.0,
-                "A": float(np.sum(a_vals ** 2)) if len(a_vals) > 0 else 0.0,
-            }
-            DE = _directional_entropy(energies)
+            SE, TE, DE = _entropies_from_spectra(request.spectra)
+            dSE_dt = 0.0
+
+        else:
+            SE = TE = DE = dSE_dt = 0.0
 
         # ── Stability Index ──
         SI = 1.0 - (W_SE * SE + W_TE * TE + W_DE * DE)
-        SI = max(0.0, min(1.0, SI))
+        SI = clamp(SI)
 
         # ── State Rules ──
         triggered_rules: List[str] = []
@@ -5,13 +5,15 @@ SSI = Σ(weight_i × block_score_i)
 """
 import time
 import structlog
-from typing import Dict
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from ..schemas import (
     ModuleCRequest, ModuleCResponse, SystemState, TrendClass, StabilityState
 )
 from ..rules.loader import load_profiles
-from ..config import classify_ssi
+from ..config import clamp, classify_ssi
 
 # ─── Profile Definitions — loaded from rules/profiles.yaml ───────
 
@@ -22,6 +24,15 @@ DEFAULT_PROFILE = {
 }
 
 
+# Confidence-gated trend rules: trend -> (minimum confidence, block score).
+# The trends are mutually exclusive, so one lookup replaces three checks.
+_TREND_RULES = {
+    TrendClass.Accelerating: (0.70, 0.85),  # BSR001
+    TrendClass.Step: (0.70, 0.80),          # BSR003
+    TrendClass.Drift: (0.60, 0.65),         # BSR002
+}
+
+
 def _block_score(b_match: float, trend_class: TrendClass, confidence: float,
                  process_corr: float) -> float:
     """
@@ -31,15 +42,10 @@ def _block_score(b_match: float, trend_class: TrendClass, confidence: float,
     # BSR007: Very strong initiator
     if b_match >= 0.90:
         return 0.90
-    # BSR001: Accelerating + high confidence
-    if trend_class == TrendClass.Accelerating and confidence >= 0.70:
-        return 0.85
-    # BSR003: Step + high confidence
-    if trend_class == TrendClass.Step and confidence >= 0.70:
-        return 0.80
-    # BSR002: Drift + moderate confidence
-    if trend_class == TrendClass.Drift and confidence >= 0.60:
-        return 0.65
+    # BSR001 / BSR003 / BSR002: trend + enough confidence
+    rule = _TREND_RULES.get(trend_class)
+    if rule is not None and confidence >= rule[0]:
+        return rule[1]
     # BSR004: Chaotic + high process correlation
     if trend_class == TrendClass.Chaotic and process_corr >= 0.70:
         return 0.35
@@ -53,40 +59,83 @@ def _block_score(b_match: float, trend_class: TrendClass, confidence: float,
     return 0.40
 
 
+# TrendClass as small integers for the vectorised rules
+_TREND_IDS = {trend: i for i, trend in enumerate(TrendClass)}
+_STABLE = _TREND_IDS[TrendClass.Stable]
+_DRIFT = _TREND_IDS[TrendClass.Drift]
+_ACCELERATING = _TREND_IDS[TrendClass.Accelerating]
+_CHAOTIC = _TREND_IDS[TrendClass.Chaotic]
+_STEP = _TREND_IDS[TrendClass.Step]
+
+
+def _block_score_batch(b_match: np.ndarray, trend: np.ndarray, confidence: np.ndarray,
+                       process_corr: np.ndarray) -> np.ndarray:
+    """:func:`_block_score` over arrays of blocks; ``trend`` holds ``_TREND_IDS``.
+
+    ``np.select`` takes the first condition that holds, so the rules keep
+    their BSR priority order.
+    """
+    stable = trend == _STABLE
+    return np.select(
+        [
+            b_match >= 0.90,                                    # BSR007
+            (trend == _ACCELERATING) & (confidence >= 0.70),    # BSR001
+            (trend == _STEP) & (confidence >= 0.70),            # BSR003
+            (trend == _DRIFT) & (confidence >= 0.60),           # BSR002
+            (trend == _CHAOTIC) & (process_corr >= 0.70),       # BSR004
+            (b_match >= 0.70) & (stable | (confidence < 0.50)),  # BSR005
+            (b_match < 0.30) & stable,                          # BSR006
+        ],
+        [0.90, 0.85, 0.80, 0.65, 0.35, 0.55, 0.15],
+        default=0.40,
+    )
+
+
 def _ssi_to_state(ssi: float) -> SystemState:
     """Classify SSI into system state — delegates to shared config."""
     return classify_ssi(ssi)
 
 
+_STATE_ACTIONS = {
+    SystemState.stable: "monitor",
+    SystemState.degrading: "alert",
+    SystemState.unstable: "intervene",
+    SystemState.critical: "shutdown_or_trip",
+    SystemState.process_driven: "investigate_process",
+}
+
+
 def _state_to_action(state: SystemState) -> str:
-    return {
-        SystemState.stable: "monitor",
-        SystemState.degrading: "alert",
-        SystemState.unstable: "intervene",
-        SystemState.critical: "shutdown_or_trip",
-        SystemState.process_driven: "investigate_process",
-    }.get(state, "monitor")
+    return _STATE_ACTIONS.get(state, "monitor")
 
 
 def _load_and_normalize_weights(system_type: str, blocks: Dict) -> tuple:
     """Load profile for system_type and renormalize weights for present blocks.
 
     Returns (profile_id, weights) where weights maps block names to
-    normalized floats summing to ~1.0.
+    normalized floats summing to ~1.0. The result is shared between calls
+    and must not be mutated.
     """
+    return _normalized_weights(system_type, tuple(blocks))
+
+
+@lru_cache(maxsize=256)
+def _normalized_weights(system_type: str, block_names: Tuple[str, ...]) -> tuple:
+    # A site sends the same system type and block set on every request,
+    # so the renormalised weights are memoised per (type, blocks).
     profiles = load_profiles()
     profile = profiles.get(system_type, DEFAULT_PROFILE)
     profile_id = profile["id"]
     weights = profile.get("weights", {})
 
     # If no profile weights, distribute evenly
-    if not weights and blocks:
-        n = len(blocks)
-        weights = {k: 1.0 / n for k in blocks}
+    if not weights and block_names:
+        n = len(block_names)
+        weights = {k: 1.0 / n for k in block_names}
 
     # Renormalize weights for blocks actually present
     if weights:
-        active_weights = {k: weights[k] for k in blocks if k in weights}
+        active_weights = {k: weights[k] for k in block_names if k in weights}
         weight_sum = sum(active_weights.values())
         if weight_sum > 0 and weight_sum < 0.99:  # Missing blocks
             active_weights = {k: v / weight_sum for k, v in active_weights.items()}
@@ -95,18 +144,26 @@ def _load_and_normalize_weights(system_type: str, blocks: Dict) -> tuple:
     return profile_id, weights
 
 
-def _compute_block_scores(blocks: Dict) -> Dict[str, float]:
-    """Compute block scores from B/B+/B++ outputs for each block."""
+def _compute_block_scores(blocks: Dict) -> Tuple[Dict[str, float], bool]:
+    """Compute block scores from B/B+/B++ outputs for each block.
+
+    The same pass counts process-correlated blocks, so the second value is
+    :func:`_check_process_driven` for ``blocks``.
+    """
     block_scores = {}
+    process_count = 0
     for block_name, block_input in blocks.items():
+        process_corr = block_input.process_correlation
         bs = _block_score(
             block_input.B_match_score,
             block_input.Bplus_trend_class,
             block_input.Bplus_confidence,
-            block_input.process_correlation,
+            process_corr,
         )
         block_scores[block_name] = bs
-    return block_scores
+        if process_corr >= 0.70:
+            process_count += 1
+    return block_scores, process_count > len(blocks) / 2
 
 
 def _aggregate_ssi(block_scores: Dict[str, float], weights: Dict[str, float]) -> float:
@@ -115,7 +172,7 @@ def _aggregate_ssi(block_scores: Dict[str, float], weights: Dict[str, float]) ->
     for block_name, score in block_scores.items():
         w = weights.get(block_name, 0.0)
         ssi += w * score
-    return max(0.0, min(1.0, ssi))
+    return clamp(ssi)
 
 
 def _check_process_driven(blocks: Dict) -> bool:
@@ -137,7 +194,12 @@ def _rank_contributors(block_scores: Dict[str, float], weights: Dict[str, float]
     return [c[0] for c in contributions[:top_n]]
 
 
-def run(request: ModuleCRequest) -> ModuleCResponse:
+def run(request: ModuleCRequest,
+        block_scores: Optional[Dict[str, float]] = None) -> ModuleCResponse:
+    """Fuse block scores into the SSI.
+
+    ``block_scores`` may carry precomputed scores for ``request.blocks``.
+    """
     t0 = time.perf_counter()
     try:
         default_profile_id, weights = _load_and_normalize_weights(
@@ -145,7 +207,10 @@ def run(request: ModuleCRequest) -> ModuleCResponse:
         )
         profile_id = request.profile_id or default_profile_id
 
-        block_scores = _compute_block_scores(request.blocks)
+        if block_scores is None:
+            block_scores, process_driven = _compute_block_scores(request.blocks)
+        else:
+            process_driven = _check_process_driven(request.blocks)
         ssi = _aggregate_ssi(block_scores, weights)
 
         # Gating rule: B++ critical instability -> SSI floor
@@ -153,7 +218,7 @@ def run(request: ModuleCRequest) -> ModuleCResponse:
             ssi = max(ssi, 0.70)
 
         # System state
-        if _check_process_driven(request.blocks):
+        if process_driven:
             system_state = SystemState.process_driven
         else:
             system_state = _ssi_to_state(ssi)
@@ -179,3 +244,23 @@ def run(request: ModuleCRequest) -> ModuleCResponse:
             SSI=0.0,
             system_state=SystemState.stable,
         )
+
+
+def run_batch(requests: List[ModuleCRequest]) -> List[ModuleCResponse]:
+    """Run many requests, scoring the blocks of all of them in one vectorised pass."""
+    blocks = [b for r in requests for b in r.blocks.values()]
+    scores = _block_score_batch(
+        np.fromiter((b.B_match_score for b in blocks), dtype=np.float64, count=len(blocks)),
+        np.fromiter((_TREND_IDS[b.Bplus_trend_class] for b in blocks), dtype=np.int8,
+                    count=len(blocks)),
+        np.fromiter((b.Bplus_confidence for b in blocks), dtype=np.float64, count=len(blocks)),
+        np.fromiter((b.process_correlation for b in blocks), dtype=np.float64, count=len(blocks)),
+    ).tolist()
+
+    responses = []
+    start = 0
+    for request in requests:
+        end = start + len(request.blocks)
+        responses.append(run(request, dict(zip(request.blocks, scores[start:end]))))
+        start = end
+    return responses
@@ -2,20 +2,33 @@
 Module D — Fault Mechanism (Health Stages)
 Maps SSI + SSI_slope into a degradation stage, RUL band, and escalation level.
 """
+import math
 import time
 import structlog
+from bisect import bisect_right
 
 from ..schemas import (
     ModuleDRequest, ModuleDResponse, HealthStage, EscalationLevel, SystemState
 )
-from ..config import SSI_THRESHOLDS, SLOPE_THRESHOLDS
+from ..config import (
+    SSI_THRESHOLDS, SLOPE_ESCALATION_UNSTABLE, SLOPE_ESCALATION_DEGRADING,
+)
 
 # ─── Module D Constants (from shared config) ─────────────────────
 SSI_CRITICAL = SSI_THRESHOLDS[SystemState.critical][0]
 SSI_UNSTABLE = SSI_THRESHOLDS[SystemState.unstable][0]
 SSI_DEGRADING = SSI_THRESHOLDS[SystemState.degrading][0]
-SLOPE_ESCALATION_UNSTABLE = SLOPE_THRESHOLDS["escalation_unstable"]
-SLOPE_ESCALATION_DEGRADING = SLOPE_THRESHOLDS["escalation_degrading"]
+
+# Stage table, indexed by how many SSI bounds the score reaches:
+# (stage, RUL band, escalation level, recommended action)
+_STAGE_BOUNDS = (SSI_DEGRADING, SSI_UNSTABLE, SSI_CRITICAL)
+_STAGES = (
+    (HealthStage.Healthy, "> 6 months", EscalationLevel.Level_0, "Continue monitoring"),
+    (HealthStage.Degrading, "1-6 months", EscalationLevel.Level_1, "Schedule inspection"),
+    (HealthStage.Unstable, "1-4 weeks", EscalationLevel.Level_2, "Prepare intervention"),
+    (HealthStage.Critical, "< 7 days", EscalationLevel.Level_3, "Immediate intervention required"),
+)
+_HEALTHY, _DEGRADING, _UNSTABLE = 0, 1, 2
 
 
 def run(request: ModuleDRequest) -> ModuleDResponse:
@@ -31,43 +44,17 @@ def run(request: ModuleDRequest) -> ModuleDResponse:
         # SSI < 0.30 AND slope ≤ 0.02 → Healthy
         # Edge cases: use SSI as primary, slope as tiebreaker
 
-        if ssi >= SSI_CRITICAL:
-            stage = HealthStage.Critical
-            rul_band = "< 7 days"
-        elif ssi >= SSI_UNSTABLE:
-            stage = HealthStage.Unstable
-            rul_band = "1-4 weeks"
-        elif ssi >= SSI_DEGRADING:
-            stage = HealthStage.Degrading
-            rul_band = "1-6 months"
-        else:
-            stage = HealthStage.Healthy
-            rul_band = "> 6 months"
+        # bisect_right counts the bounds with ssi >= bound; NaN reaches none
+        level = _HEALTHY if math.isnan(ssi) else bisect_right(_STAGE_BOUNDS, ssi)
 
         # Slope can escalate a borderline case
-        if stage == HealthStage.Degrading and slope > SLOPE_ESCALATION_UNSTABLE:
-            stage = HealthStage.Unstable
-            rul_band = "1-4 weeks"
-        elif stage == HealthStage.Healthy and slope > SLOPE_ESCALATION_DEGRADING:
-            stage = HealthStage.Degrading
-            rul_band = "1-6 months"
+        if level == _DEGRADING and slope > SLOPE_ESCALATION_UNSTABLE:
+            level = _UNSTABLE
+        elif level == _HEALTHY and slope > SLOPE_ESCALATION_DEGRADING:
+            level = _DEGRADING
 
         # ── Escalation Level ──
-        if stage == HealthStage.Critical:
-            escalation = EscalationLevel.Level_3
-            action = "Immediate intervention required"
-        elif stage == HealthStage.Unstable:
-            escalation = EscalationLevel.Level_2
-            action = "Prepare intervention"
-        elif stage == HealthStage.Degrading and slope > 0.03:
-            escalation = EscalationLevel.Level_1
-            action = "Schedule inspection"
-        elif stage == HealthStage.Degrading:
-            escalation = EscalationLevel.Level_1
-            action = "Schedule inspection"
-        else:
-            escalation = EscalationLevel.Level_0
-            action = "Continue monitoring"
+        stage, rul_band, escalation, action = _STAGES[level]
 
         elapsed = (time.perf_counter() - t0) * 1000
         return ModuleDResponse(
@@ -4,33 +4,37 @@ P = 100 × (0.45·S + 0.25·C + 0.20·K + 0.10·U) × M_safe × R_sp × R_mp
 """
 import time
 import structlog
-from typing import List
+import numpy as np
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from ..schemas import (
     ModuleERequest, ModuleEResponse, PlanItem
 )
-from ..rules.loader import load_actions
-from ..config import PRIORITY_WEIGHTS, PRIORITY_MODIFIERS, PRIORITY_WINDOWS
-
+from ..rules.loader import load_actions_compiled
 # ─── Module E Constants (from shared config) ─────────────────────
-W_SEVERITY = PRIORITY_WEIGHTS["severity"]
-W_CONFIDENCE = PRIORITY_WEIGHTS["confidence"]
-W_CRITICALITY = PRIORITY_WEIGHTS["criticality"]
-W_URGENCY = PRIORITY_WEIGHTS["urgency"]
-SAFETY_MULTIPLIER = PRIORITY_MODIFIERS["safety_multiplier"]
-SPARES_PENALTY = PRIORITY_MODIFIERS["spares_penalty"]
-MANPOWER_PENALTY = PRIORITY_MODIFIERS["manpower_penalty"]
-PRIORITY_IMMEDIATE = PRIORITY_WINDOWS["immediate"]
-PRIORITY_24H = PRIORITY_WINDOWS["24h"]
-PRIORITY_7D = PRIORITY_WINDOWS["7d"]
+from ..config import (
+    W_SEVERITY, W_CONFIDENCE, W_CRITICALITY, W_URGENCY,
+    SAFETY_MULTIPLIER, SPARES_PENALTY, MANPOWER_PENALTY,
+    PRIORITY_IMMEDIATE, PRIORITY_24H, PRIORITY_7D,
+    clamp,
+)
+
+log = structlog.get_logger(__name__)
 
 
 def _select_actions(diagnosis: str | None, priority: float) -> List[str]:
     """Pick action IDs based on diagnosis keywords and priority."""
-    actions_data = load_actions()
-    diagnosis_map = actions_data.get("diagnosis_map", {})
+    return list(_actions_for(diagnosis, priority >= PRIORITY_IMMEDIATE))
 
-    if priority >= PRIORITY_IMMEDIATE:
+
+@lru_cache(maxsize=512)
+def _actions_for(diagnosis: str | None, immediate: bool) -> Tuple[str, ...]:
+    # Priority only matters through the Immediate threshold, so the
+    # selection is memoised per (diagnosis, immediate): a monitored asset
+    # repeats the same diagnosis request after request.
+    if immediate:
         # Always include shutdown recommendation at top
         actions = ["ACT008"]
     else:
@@ -38,7 +42,7 @@ def _select_actions(diagnosis: str | None, priority: float) -> List[str]:
 
     if diagnosis:
         diag_lower = diagnosis.lower()
-        for keyword, act_ids in diagnosis_map.items():
+        for keyword, act_ids in load_actions_compiled().diagnosis_items:
             if keyword in diag_lower:
                 actions.extend(act_ids)
 
@@ -46,70 +50,81 @@ def _select_actions(diagnosis: str | None, priority: float) -> List[str]:
     if not actions:
         actions = ["ACT001"]
 
-    # Deduplicate while preserving order
-    seen = set()
-    unique = []
-    for a in actions:
-        if a not in seen:
-            seen.add(a)
-            unique.append(a)
-    return unique
+    # Deduplicate while preserving order (dicts keep insertion order)
+    return tuple(dict.fromkeys(actions))
+
+
+def _catalog_entry(catalog: Dict[str, Tuple[str, str, str]],
+                   act_id: str) -> Tuple[str, str, str]:
+    """(title, justification, verification) for ``act_id``.
+
+    The placeholder is only built on a miss.
+    """
+    entry = catalog.get(act_id)
+    if entry is None:
+        return f"Action {act_id}", "See diagnosis", "Verify post-action"
+    return entry
+
+
+# Window by number of thresholds ≤ P (P is clamped, never NaN)
+_WINDOW_BOUNDS = (PRIORITY_7D, PRIORITY_24H, PRIORITY_IMMEDIATE)
+_WINDOWS = ("Next shutdown", "7 days", "24 hours", "Immediate")
 
 
 def _priority_window(p: float) -> str:
-    if p >= PRIORITY_IMMEDIATE:
-        return "Immediate"
-    elif p >= PRIORITY_24H:
-        return "24 hours"
-    elif p >= PRIORITY_7D:
-        return "7 days"
-    return "Next shutdown"
+    return _WINDOWS[bisect_right(_WINDOW_BOUNDS, p)]
 
 
-def run(request: ModuleERequest) -> ModuleEResponse:
+def run(request: ModuleERequest, priority: Optional[float] = None) -> ModuleEResponse:
+    """Build the maintenance plan.
+
+    ``priority`` may carry a precomputed (already clamped) priority score P.
+    """
     t0 = time.perf_counter()
     try:
-        S = request.severity_score
-        C = request.confidence
-        K = request.criticality
-        U = request.urgency
+        if priority is None:
+            S = request.severity_score
+            C = request.confidence
+            K = request.criticality
+            U = request.urgency
 
-        # Safety multiplier
-        M_safe = SAFETY_MULTIPLIER if request.safety_flag else 1.0
+            # Safety multiplier
+            M_safe = SAFETY_MULTIPLIER if request.safety_flag else 1.0
 
-        # Spares readiness modifier
-        R_sp = 1.0 if request.spares_ready else SPARES_PENALTY
+            # Spares readiness modifier
+            R_sp = 1.0 if request.spares_ready else SPARES_PENALTY
 
-        # Manpower readiness modifier
-        R_mp = 1.0 if request.manpower_ready else MANPOWER_PENALTY
+            # Manpower readiness modifier
+            R_mp = 1.0 if request.manpower_ready else MANPOWER_PENALTY
 
-        # Priority formula
-        base = W_SEVERITY * S + W_CONFIDENCE * C + W_CRITICALITY * K + W_URGENCY * U
-        P = 100.0 * base * M_safe * R_sp * R_mp
-        P = max(0.0, min(100.0, P))
+            # Priority formula
+            base = W_SEVERITY * S + W_CONFIDENCE * C + W_CRITICALITY * K + W_URGENCY * U
+            P = 100.0 * base * M_safe * R_sp * R_mp
+            P = clamp(P, 100.0)
+        else:
+            P = priority
 
         window = _priority_window(P)
 
         # Select actions
         action_ids = _select_actions(request.diagnosis, P)
 
-        actions_data = load_actions()
-        plan_items: List[PlanItem] = []
-        for rank, act_id in enumerate(action_ids, start=1):
-            cat = actions_data.get(act_id, {
-                "title": f"Action {act_id}",
-                "justification": "See diagnosis",
-                "verification": "Verify post-action",
-            })
-            plan_items.append(PlanItem(
+        catalog = load_actions_compiled().actions
+        priority_score = round(P, 2)
+        entries = [_catalog_entry(catalog, act_id) for act_id in action_ids]
+        plan_items = [
+            PlanItem(
                 rank=rank,
-                priority_score=round(P, 2),
+                priority_score=priority_score,
                 window=window,
                 action_id=act_id,
-                action_title=cat["title"],
-                justification=cat["justification"],
-                verification=cat["verification"],
-            ))
+                action_title=title,
+                justification=justification,
+                verification=verification,
+            )
+            for rank, (act_id, (title, justification, verification))
+            in enumerate(zip(action_ids, entries), start=1)
+        ]
 
         elapsed = (time.perf_counter() - t0) * 1000
         return ModuleEResponse(
@@ -119,9 +134,38 @@ def run(request: ModuleERequest) -> ModuleEResponse:
         )
     except Exception as e:
         elapsed = (time.perf_counter() - t0) * 1000
-        structlog.get_logger(__name__).error("module_error", module="E", error=str(e), exc_info=True)
+        log.error("module_error", module="E", error=str(e), exc_info=True)
         return ModuleEResponse(
             execution_time_ms=round(elapsed, 2),
             plan_items=[],
             total_actions=0,
         )
+
+
+def run_batch(requests: List[ModuleERequest]) -> List[ModuleEResponse]:
+    """Run many requests, computing every priority score in one vectorised pass.
+
+    The arrays are combined in the same order as :func:`run`, so each P is
+    bit-identical to the scalar result.
+    """
+    n = len(requests)
+
+    def column(values, dtype=np.float64):
+        return np.fromiter(values, dtype=dtype, count=n)
+
+    S = column(r.severity_score for r in requests)
+    C = column(r.confidence for r in requests)
+    K = column(r.criticality for r in requests)
+    U = column(r.urgency for r in requests)
+    # Flags are packed as one-byte bools and expanded to their factors in C
+    M_safe = np.where(column((r.safety_flag for r in requests), bool), SAFETY_MULTIPLIER, 1.0)
+    R_sp = np.where(column((r.spares_ready for r in requests), bool), 1.0, SPARES_PENALTY)
+    R_mp = np.where(column((r.manpower_ready for r in requests), bool), 1.0, MANPOWER_PENALTY)
+
+    base = W_SEVERITY * S + W_CONFIDENCE * C + W_CRITICALITY * K + W_URGENCY * U
+    P = 100.0 * base * M_safe * R_sp * R_mp
+    # Same comparisons as config.clamp (not np.clip), so NaN maps alike
+    P = np.where(P < 100.0, P, 100.0)
+    P = np.where(P > 0.0, P, 0.0)
+
+    return [run(request, p) for request, p in zip(requests, P.tolist())]
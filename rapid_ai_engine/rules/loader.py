@@ -2,11 +2,16 @@
 YAML Rule Loader — loads externalized rules at startup and caches them.
 """
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, NamedTuple, Tuple
 from functools import lru_cache
 
 import yaml
 
+try:  # libyaml bindings, bundled with the PyYAML wheels
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pure-Python build of PyYAML
+    from yaml import SafeLoader as _SafeLoader
+
 from ..exceptions import ConfigurationError
 
 _RULES_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -17,7 +22,7 @@ def _load_yaml(filename: str) -> Dict[str, Any]:
     path = os.path.join(_RULES_DIR, filename)
     try:
         with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_SafeLoader)
     except FileNotFoundError:
         raise ConfigurationError(f"Rule file not found: {path}")
     except yaml.YAMLError as e:
@@ -33,6 +38,31 @@ def load_actions() -> Dict[str, Any]:
     return result
 
 
+class CompiledActions(NamedTuple):
+    """Action catalog flattened for per-request lookups."""
+    # (lower-cased keyword, action IDs) in catalog order
+    diagnosis_items: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    # act_id → (title, justification, verification)
+    actions: Dict[str, Tuple[str, str, str]]
+
+
+@lru_cache(maxsize=1)
+def load_actions_compiled() -> CompiledActions:
+    """Action catalog with keywords lower-cased and entries as plain tuples."""
+    data = load_actions()
+    return CompiledActions(
+        diagnosis_items=tuple(
+            (keyword.lower(), tuple(act_ids))
+            for keyword, act_ids in data["diagnosis_map"].items()
+        ),
+        actions={
+            act_id: (entry["title"], entry["justification"], entry["verification"])
+            for act_id, entry in data.items()
+            if act_id != "diagnosis_map"
+        },
+    )
+
+
 @lru_cache(maxsize=1)
 def load_profiles() -> Dict[str, Any]:
     """Load system profiles with weights."""
@@ -3,7 +3,7 @@ RAPID AI — Canonical Pydantic Schemas (v1.0 Frozen)
 All request/response models for Modules 0 through F + Orchestrator.
 """
 from __future__ import annotations
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
 import math
@@ -287,6 +287,8 @@ class ModuleERequest(BaseModel):
     component: Optional[str] = None
 
 class PlanItem(BaseModel):
+    # E/F outputs are built once per request and never mutated
+    model_config = ConfigDict(frozen=True)
     rank: int
     priority_score: float
     window: str
@@ -296,6 +298,7 @@ class PlanItem(BaseModel):
     verification: str
 
 class ModuleEResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
     module: str = "ModuleE_MaintenancePlan"
     plan_items: List[PlanItem] = Field(default_factory=list)
     total_actions: int = 0
@@ -327,6 +330,7 @@ class ModuleFRequest(BaseModel):
 
 class ReliabilityMetrics(BaseModel):
     """Weibull-based reliability metrics from condition-adjusted model."""
+    model_config = ConfigDict(frozen=True)
     beta_base: float = 1.0
     beta_adj: float = 1.0
     eta_base_hours: float = 50000.0
@@ -339,6 +343,7 @@ class ReliabilityMetrics(BaseModel):
     nowlan_heap_pattern: str = "E"
 
 class ModuleFResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
     module: str = "ModuleF_Governance"
     RUL_days: float = 0.0
     failure_probability_30d: float = 0.0
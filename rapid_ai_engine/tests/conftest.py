@@ -5,18 +5,28 @@ from fastapi.testclient import TestClient
 from rapid_ai_engine.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """FastAPI test client."""
-    return TestClient(app)
+    """FastAPI test client, shared by the session.
 
+    Entering the client runs the app lifespan (logging setup and warm-up)
+    once; leaving it shuts the module executor down, so it must not be
+    re-entered per test.
+    """
+    with TestClient(app) as c:
+        yield c
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_signal():
-    """Minimal valid signal (256 samples of sine wave + noise)."""
-    np.random.seed(42)
+    """Minimal valid signal (256 samples of sine wave + noise).
+
+    Built once per session from a private generator; tests must not
+    mutate the list in place.
+    """
+    rng = np.random.default_rng(42)
     t = np.linspace(0, 1, 256)
-    values = (2.0 * np.sin(2 * np.pi * 50 * t) + 0.5 * np.random.randn(256)).tolist()
+    values = (2.0 * np.sin(2 * np.pi * 50 * t) + 0.5 * rng.standard_normal(256)).tolist()
     return values
 
 
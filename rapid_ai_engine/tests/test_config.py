@@ -1,12 +1,13 @@
 """Tests for shared config — single source of truth for thresholds."""
+import math
 import pytest
 from rapid_ai_engine.config import (
     SEVERITY_THRESHOLDS,
-    SSI_THRESHOLDS,
     WEIBULL_COEFFICIENTS,
     SEDL_WEIGHTS,
     classify_severity,
     classify_ssi,
+    clamp,
 )
 from rapid_ai_engine.schemas import SeverityLevel, SystemState
 
@@ -28,6 +29,10 @@ class TestSeverityClassification:
         assert classify_severity(0.80) == SeverityLevel.alarm
         assert classify_severity(1.0) == SeverityLevel.alarm
 
+    def test_out_of_range(self):
+        assert classify_severity(-0.1) == SeverityLevel.normal
+        assert classify_severity(1.5) == SeverityLevel.alarm
+
 
 class TestSSIClassification:
     def test_stable(self):
@@ -59,3 +64,13 @@ class TestConstants:
 
     def test_sedl_weights_sum_to_one(self):
         assert abs(sum(SEDL_WEIGHTS.values()) - 1.0) < 0.001
+
+
+class TestClamp:
+    @pytest.mark.parametrize("value", [-3.0, -0.0, 0.0, 0.4, 1.0, 7.5, math.inf, -math.inf, math.nan])
+    @pytest.mark.parametrize("upper", [1.0, 100.0])
+    def test_matches_min_max(self, value, upper):
+        expected = max(0.0, min(upper, value))
+        got = clamp(value, upper)
+        assert got == expected
+        assert math.copysign(1.0, got) == math.copysign(1.0, expected)
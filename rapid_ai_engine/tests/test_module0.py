@@ -1,7 +1,8 @@
 """Tests for Module 0 — Data Guard."""
 import numpy as np
-from rapid_ai_engine.schemas import Module0Request, SignalInput, ContextInput, StatusLevel, MountType
-from rapid_ai_engine.modules.module0_dataguard import run
+import pytest
+from rapid_ai_engine.schemas import Module0Request, SignalInput, ContextInput, StatusLevel
+from rapid_ai_engine.modules.module0_dataguard import run, run_batch, run_with_stats
 
 
 def _make_request(values, signal_type="velocity", unit="mm/s", fs=6400, **kwargs):
@@ -32,6 +33,12 @@ class TestHardBlocks:
         assert resp.block is True
         assert any("DG_005" in r for r in resp.reasons)
 
+    def test_blocked_metrics_are_measured(self):
+        resp = run(_make_request([3.0] * 300, unit="invalid"))
+        assert resp.metrics.sample_count == 300
+        assert resp.metrics.rms == pytest.approx(3.0)
+        assert resp.metrics.peak == pytest.approx(3.0)
+
 
 class TestSoftPenalties:
     def test_dg003_nan_fraction(self):
@@ -73,3 +80,28 @@ class TestQualityScoring:
         resp = run(_make_request([float(v) for v in values]))
         assert resp.metrics.sample_count == 300
         assert resp.metrics.rms > 0
+
+    def test_run_with_stats_returns_shared_stats(self):
+        values = [float(v) for v in range(300)]
+        resp, stats = run_with_stats(_make_request(values))
+        assert stats.n == 300
+        assert resp.metrics.rms == pytest.approx(stats.rms, abs=1e-6)
+
+
+class TestBatch:
+    def test_run_batch_matches_run(self):
+        rng = np.random.default_rng(3)
+        batch = [rng.normal(1.0, 0.5, 512).tolist() for _ in range(4)]
+        batch.append([5.0] * 512)                           # flatline, same length
+        batch.append([1.0] * 500 + [float("nan")] * 12)     # NaN row, same length
+        batch.append(rng.normal(0.0, 2.0, 300).tolist())    # singleton length
+        batch.append([1.0] * 100)                           # hard block
+        requests = [_make_request(v) for v in batch]
+
+        for got, want in zip(run_batch(requests), (run(r) for r in requests)):
+            assert got.status == want.status
+            assert got.flags == want.flags
+            assert got.reasons == want.reasons
+            assert got.quality_score == want.quality_score
+            for field, value in want.metrics.model_dump().items():
+                assert getattr(got.metrics, field) == pytest.approx(value, abs=1e-6)
@@ -1,7 +1,10 @@
 """Tests for Module A — Trend Engine."""
 import numpy as np
 from rapid_ai_engine.schemas import ModuleARequest, SeverityLevel
-from rapid_ai_engine.modules.moduleA_trend import run
+from rapid_ai_engine.modules.moduleA_trend import run, _logistic, _logistic_array
+from rapid_ai_engine.modules._stats import (
+    CENTRED_INDEX_CACHE_MAX, _cached_centred_index, centred_index, signal_stats,
+)
 
 
 def _make_request(values, baseline=None):
@@ -26,6 +29,27 @@ class TestFeatureExtraction:
         resp = run(_make_request([1.0]))
         assert resp.overall_rms == 0.0
 
+    def test_precomputed_stats_match(self):
+        values = list(np.random.default_rng(7).normal(2.0, 0.5, 1024))
+        req = _make_request(values, baseline=1.5)
+        shared = run(req, signal_stats(values)).model_dump(exclude={"execution_time_ms"})
+        assert shared == run(req).model_dump(exclude={"execution_time_ms"})
+
+
+class TestCentredIndex:
+    def test_values_and_read_only(self):
+        for n in (5, CENTRED_INDEX_CACHE_MAX + 1):
+            x = centred_index(n)
+            assert np.array_equal(x, np.arange(n) - (n - 1) / 2.0)
+            assert not x.flags.writeable
+
+    def test_long_lengths_are_not_cached(self):
+        _cached_centred_index.cache_clear()
+        centred_index(CENTRED_INDEX_CACHE_MAX + 1)
+        assert _cached_centred_index.cache_info().currsize == 0
+        centred_index(CENTRED_INDEX_CACHE_MAX)
+        assert _cached_centred_index.cache_info().currsize == 1
+
 
 class TestSeverityScoring:
     def test_baseline_ratio_boost_alarm(self):
@@ -40,6 +64,12 @@ class TestSeverityScoring:
         resp = run(_make_request([1.0] * 300))
         assert resp.severity_level in [SeverityLevel.normal, SeverityLevel.watch]
 
+    def test_logistic_scalar_matches_array(self):
+        xs = np.array([-50.0, -3.0, 0.0, 0.7, 50.0])
+        expected = [_logistic(x) for x in xs]
+        assert np.allclose(_logistic_array(xs), expected, rtol=0, atol=1e-15)
+        assert _logistic(0.0) == 0.5
+
 
 class TestClassification:
     def test_machine_classification(self):
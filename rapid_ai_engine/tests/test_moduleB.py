@@ -1,8 +1,9 @@
 """Tests for Module B — Initiator Rules."""
 import math
 from rapid_ai_engine.schemas import ModuleBRequest, SignalInput, ContextInput, SignalType, Direction
-from rapid_ai_engine.modules.moduleB_initiators import run, RULES_DB
+from rapid_ai_engine.modules.moduleB_initiators import run, run_batch, RULES_DB, _COMPILED
 from rapid_ai_engine.main import (
+    _signals_by_direction,
     _extract_triaxial_metrics,
     _extract_triaxial_spectra,
     _extract_temperature,
@@ -19,6 +20,11 @@ class TestRuleLoading:
             assert comp in RULES_DB, f"Missing component: {comp}"
             assert len(RULES_DB[comp]) > 0, f"Empty rules for: {comp}"
 
+    def test_compiled_rules_mirror_rules_db(self):
+        assert _COMPILED.keys() == RULES_DB.keys()
+        for comp, rules in RULES_DB.items():
+            assert [r.rule_id for r in _COMPILED[comp]] == [r["rule_id"] for r in rules]
+
 
 class TestRuleMatching:
     def test_afb06_imbalance(self):
@@ -52,6 +58,38 @@ class TestRuleMatching:
         rule_ids = [r.rule_id for r in resp.matched_rules]
         assert "AFB02" in rule_ids
 
+    def test_confidence_only_reports_top_match(self):
+        metrics = {"H": 1.0, "V": 3.0, "A": 0.5, "kurtosis": 6.5, "crest_factor": 3.2, "temperature": 80}
+        full = run(ModuleBRequest(asset_id="T1", component="afb", metrics=metrics))
+        top = run(ModuleBRequest(asset_id="T1", component="afb", metrics=metrics),
+                  confidence_only=True)
+        assert full.num_matches > 1
+        assert top.confidence == full.confidence
+        assert top.num_matches == 1
+        best = max(full.matched_rules, key=lambda r: r.score)
+        assert top.matched_rules[0] == best
+
+
+class TestBatch:
+    def test_run_batch_matches_run(self):
+        metrics = [
+            {"H": 3.0, "V": 2.0, "A": 0.5, "kurtosis": 2.0, "crest_factor": 1.5, "temperature": 40},
+            {"H": 1.0, "V": 3.0, "A": 0.5, "kurtosis": 6.5, "crest_factor": 3.2, "temperature": 80},
+            {"H": 1.0, "V": 1.0, "A": 1.5},
+            {},
+        ]
+        requests = [
+            ModuleBRequest(asset_id="T1", component=comp, metrics=m)
+            for comp in ("afb", "TPJB", "shafts", "unknown") for m in metrics
+        ]
+        for top in (False, True):
+            batch = run_batch(requests, confidence_only=top)
+            assert len(batch) == len(requests)
+            for got, request in zip(batch, requests):
+                want = run(request, confidence_only=top)
+                assert got.model_dump(exclude={"execution_time_ms"}) == \
+                    want.model_dump(exclude={"execution_time_ms"})
+
 
 class TestNewComponents:
     def test_tpjb_rules_exist(self):
@@ -80,13 +118,13 @@ def _make_signal(direction: str, values: list[float]) -> SignalInput:
 
 class TestExtractTriaxialMetrics:
     def test_proxy_fallback_when_no_additional_signals(self):
-        result = _extract_triaxial_metrics(2.8, None)
+        result = _extract_triaxial_metrics(2.8, _signals_by_direction(None))
         assert result["H"] == 2.8
         assert math.isclose(result["V"], 2.8 * TRIAXIAL_PROXY["v_from_h"], rel_tol=1e-9)
         assert math.isclose(result["A"], 2.8 * TRIAXIAL_PROXY["a_from_h"], rel_tol=1e-9)
 
     def test_proxy_fallback_when_empty_list(self):
-        result = _extract_triaxial_metrics(2.8, [])
+        result = _extract_triaxial_metrics(2.8, _signals_by_direction([]))
         assert math.isclose(result["V"], 2.8 * TRIAXIAL_PROXY["v_from_h"], rel_tol=1e-9)
         assert math.isclose(result["A"], 2.8 * TRIAXIAL_PROXY["a_from_h"], rel_tol=1e-9)
 
@@ -94,7 +132,7 @@ class TestExtractTriaxialMetrics:
         """Constant signal of 2.1 should have RMS = 2.1."""
         v_signal = _make_signal("V", [2.1] * 100)
         a_signal = _make_signal("A", [1.9] * 100)
-        result = _extract_triaxial_metrics(2.8, [v_signal, a_signal])
+        result = _extract_triaxial_metrics(2.8, _signals_by_direction([v_signal, a_signal]))
         assert result["H"] == 2.8
         assert math.isclose(result["V"], 2.1, rel_tol=1e-6)
         assert math.isclose(result["A"], 1.9, rel_tol=1e-6)
@@ -102,21 +140,21 @@ class TestExtractTriaxialMetrics:
     def test_partial_signals_v_only(self):
         """Only V provided — A should fall back to proxy."""
         v_signal = _make_signal("V", [3.0] * 50)
-        result = _extract_triaxial_metrics(2.0, [v_signal])
+        result = _extract_triaxial_metrics(2.0, _signals_by_direction([v_signal]))
         assert math.isclose(result["V"], 3.0, rel_tol=1e-6)
         assert math.isclose(result["A"], 2.0 * TRIAXIAL_PROXY["a_from_h"], rel_tol=1e-9)
 
     def test_empty_values_falls_back_to_proxy(self):
         """Signal with empty values list should fall back to proxy."""
         v_signal = _make_signal("V", [])
-        result = _extract_triaxial_metrics(2.0, [v_signal])
+        result = _extract_triaxial_metrics(2.0, _signals_by_direction([v_signal]))
         assert math.isclose(result["V"], 2.0 * TRIAXIAL_PROXY["v_from_h"], rel_tol=1e-9)
 
 
 class TestExtractTriaxialSpectra:
     def test_no_additional_signals(self):
         h_vals = list(range(300))
-        result = _extract_triaxial_spectra(h_vals, None)
+        result = _extract_triaxial_spectra(h_vals, _signals_by_direction(None))
         assert len(result["H"]) == 256  # Truncated to 256
         assert result["V"] == []
         assert result["A"] == []
@@ -125,7 +163,7 @@ class TestExtractTriaxialSpectra:
         h_vals = list(range(300))
         v_signal = _make_signal("V", list(range(200)))
         a_signal = _make_signal("A", list(range(400)))
-        result = _extract_triaxial_spectra(h_vals, [v_signal, a_signal])
+        result = _extract_triaxial_spectra(h_vals, _signals_by_direction([v_signal, a_signal]))
         assert len(result["H"]) == 256
         assert len(result["V"]) == 200  # Under 256, kept as-is
         assert len(result["A"]) == 256  # Truncated to 256
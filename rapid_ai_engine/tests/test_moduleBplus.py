@@ -1,7 +1,6 @@
 """Tests for Module B+ — Slope Intelligence."""
-import numpy as np
 from rapid_ai_engine.schemas import ModuleBPlusRequest, TrendClass
-from rapid_ai_engine.modules.moduleBplus_slope import run
+from rapid_ai_engine.modules.moduleBplus_slope import run, _TREND_TABLE
 
 
 class TestTrendClassification:
@@ -23,3 +22,10 @@ class TestTrendClassification:
         resp = run(ModuleBPlusRequest(asset_id="T1", timestamps=[], values=[]))
         assert resp.trend_class == TrendClass.Stable
         assert resp.severity_score == 0.0
+
+    def test_trend_table_priority(self):
+        assert _TREND_TABLE[0b0000] == TrendClass.Stable
+        assert _TREND_TABLE[0b0001] == TrendClass.Drift
+        assert _TREND_TABLE[0b0011] == TrendClass.Accelerating
+        assert _TREND_TABLE[0b0111] == TrendClass.Chaotic
+        assert all(_TREND_TABLE[f] == TrendClass.Step for f in range(8, 16))
@@ -1,6 +1,7 @@
 """Tests for Module B++ — SEDL."""
+import numpy as np
 from rapid_ai_engine.schemas import ModuleBPPRequest, StabilityState, SeverityLevel
-from rapid_ai_engine.modules.moduleBpp_sedl import run
+from rapid_ai_engine.modules.moduleBpp_sedl import run, _uniform_histogram
 
 
 class TestPrecomputedMetrics:
@@ -32,3 +33,17 @@ class TestSIComputation:
         ))
         expected_si = 1.0 - (0.5 * 0.4 + 0.3 * 0.3 + 0.2 * 0.2)
         assert abs(resp.SI - expected_si) < 0.01
+
+
+class TestEntropyKernels:
+    def test_uniform_histogram_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        samples = [
+            rng.normal(size=257),
+            np.round(rng.normal(size=500) * 3, 1),  # many values on bin edges
+            np.full(64, 1.5),
+            np.linspace(-1.0, 1.0, 51),
+        ]
+        for values in samples:
+            expected, _ = np.histogram(values, bins=50)
+            np.testing.assert_array_equal(_uniform_histogram(values, 50), expected)
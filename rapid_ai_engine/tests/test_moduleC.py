@@ -1,9 +1,13 @@
 """Tests for Module C — Fusion (System Stability Index)."""
+import itertools
+import numpy as np
 from rapid_ai_engine.schemas import (
-    ModuleCRequest, ModuleCResponse, BlockInput, TrendClass,
+    ModuleCRequest, BlockInput, TrendClass,
     SystemState, StabilityState,
 )
-from rapid_ai_engine.modules.moduleC_fusion import run
+from rapid_ai_engine.modules.moduleC_fusion import (
+    run, run_batch, _block_score, _block_score_batch, _TREND_IDS,
+)
 
 
 class TestSSIComputation:
@@ -159,3 +163,34 @@ class TestSystemStateMapping:
         resp = run(ModuleCRequest(system_type="pump_train_horizontal", blocks=blocks))
         assert resp.SSI >= 0.80
         assert resp.system_state == SystemState.critical
+
+
+class TestBatch:
+    def test_block_score_batch_matches_rules(self):
+        levels = [0.0, 0.29, 0.30, 0.49, 0.50, 0.59, 0.60, 0.69, 0.70, 0.89, 0.90, 1.0]
+        grid = list(itertools.product(levels, TrendClass, levels, levels))
+        got = _block_score_batch(
+            np.array([g[0] for g in grid]),
+            np.array([_TREND_IDS[g[1]] for g in grid]),
+            np.array([g[2] for g in grid]),
+            np.array([g[3] for g in grid]),
+        )
+        assert got.tolist() == [_block_score(*g) for g in grid]
+
+    def test_run_batch_matches_run(self):
+        requests = [
+            ModuleCRequest(system_type="pump_train_horizontal", blocks={
+                "afb": BlockInput(B_match_score=0.95),
+                "coupling": BlockInput(Bplus_trend_class=TrendClass.Drift, Bplus_confidence=0.65),
+            }),
+            ModuleCRequest(system_type="fan_train", blocks={}),
+            ModuleCRequest(system_type="unknown", blocks={
+                "a": BlockInput(process_correlation=0.8, Bplus_trend_class=TrendClass.Chaotic),
+                "b": BlockInput(B_match_score=0.75, Bplus_confidence=0.4),
+                "c": BlockInput(B_match_score=0.1),
+            }, stability_state=StabilityState.Critical_Instability),
+        ]
+        for got, request in zip(run_batch(requests), requests):
+            want = run(request)
+            assert got.model_dump(exclude={"execution_time_ms"}) == \
+                want.model_dump(exclude={"execution_time_ms"})
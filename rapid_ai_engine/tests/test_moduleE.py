@@ -1,29 +1,32 @@
 """Tests for Module E — Maintenance Plan (Priority Scoring)."""
 import pytest
-from rapid_ai_engine.schemas import ModuleERequest, ModuleEResponse
+from pydantic import ValidationError
+from rapid_ai_engine.schemas import ModuleERequest
+from rapid_ai_engine.config import PRIORITY_7D, PRIORITY_24H, PRIORITY_IMMEDIATE
+from rapid_ai_engine.modules.moduleE_maintenance import run, run_batch, _priority_window
+
+
+_DEFAULTS = {
+    "asset_id": "TEST-E-001",
+    "severity_score": 0.5,
+    "confidence": 0.8,
+    "criticality": 0.6,
+    "urgency": 0.5,
+    "safety_flag": False,
+    "spares_ready": True,
+    "manpower_ready": True,
+    "diagnosis": None,
+}
 
 
 def _make_request(**overrides):
-    defaults = {
-        "asset_id": "TEST-E-001",
-        "severity_score": 0.5,
-        "confidence": 0.8,
-        "criticality": 0.6,
-        "urgency": 0.5,
-        "safety_flag": False,
-        "spares_ready": True,
-        "manpower_ready": True,
-        "diagnosis": None,
-    }
-    defaults.update(overrides)
-    return ModuleERequest(**defaults)
+    return ModuleERequest(**{**_DEFAULTS, **overrides})
 
 
 class TestPriorityFormula:
     """P = 100 × (0.45·S + 0.25·C + 0.20·K + 0.10·U) × M_safe × R_sp × R_mp"""
 
     def test_baseline_calculation(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request()
         # base = 0.45*0.5 + 0.25*0.8 + 0.20*0.6 + 0.10*0.5
         #      = 0.225 + 0.200 + 0.120 + 0.050 = 0.595
@@ -32,35 +35,30 @@ class TestPriorityFormula:
         assert resp.plan_items[0].priority_score == 59.5
 
     def test_safety_multiplier(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(safety_flag=True)
         # P = 100 * 0.595 * 1.5 * 1.0 * 1.0 = 89.25
         resp = run(req)
         assert resp.plan_items[0].priority_score == 89.25
 
     def test_spares_penalty(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(spares_ready=False)
         # P = 100 * 0.595 * 1.0 * 0.7 * 1.0 = 41.65
         resp = run(req)
         assert resp.plan_items[0].priority_score == 41.65
 
     def test_manpower_penalty(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(manpower_ready=False)
         # P = 100 * 0.595 * 1.0 * 1.0 * 0.7 = 41.65
         resp = run(req)
         assert resp.plan_items[0].priority_score == 41.65
 
     def test_both_penalties(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(spares_ready=False, manpower_ready=False)
         # P = 100 * 0.595 * 1.0 * 0.7 * 0.7 = 29.155
         resp = run(req)
         assert resp.plan_items[0].priority_score == 29.16  # rounded
 
     def test_clamped_to_100(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(
             severity_score=1.0, confidence=1.0,
             criticality=1.0, urgency=1.0,
@@ -74,7 +72,6 @@ class TestPriorityFormula:
 
 class TestPriorityWindow:
     def test_immediate(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         # Need P >= 85 → safety_flag + high inputs
         req = _make_request(
             severity_score=1.0, confidence=1.0,
@@ -85,7 +82,6 @@ class TestPriorityWindow:
         assert resp.plan_items[0].window == "Immediate"
 
     def test_24h_window(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         # Need 70 <= P < 85 → P = 59.5 * 1.5 = 89.25 too high
         # P=74.25: severity=0.7, conf=0.9, crit=0.7, urg=0.6, safety=True
         # base = 0.45*0.7 + 0.25*0.9 + 0.20*0.7 + 0.10*0.6 = 0.315+0.225+0.14+0.06=0.74
@@ -99,14 +95,12 @@ class TestPriorityWindow:
         assert resp.plan_items[0].window == "24 hours"
 
     def test_7d_window(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request()
         # P = 59.5
         resp = run(req)
         assert resp.plan_items[0].window == "7 days"
 
     def test_next_shutdown_window(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(
             severity_score=0.2, confidence=0.3,
             criticality=0.2, urgency=0.1,
@@ -116,17 +110,22 @@ class TestPriorityWindow:
         resp = run(req)
         assert resp.plan_items[0].window == "Next shutdown"
 
+    def test_thresholds_are_inclusive(self):
+        assert _priority_window(0.0) == "Next shutdown"
+        assert _priority_window(PRIORITY_7D) == "7 days"
+        assert _priority_window(PRIORITY_24H) == "24 hours"
+        assert _priority_window(PRIORITY_IMMEDIATE) == "Immediate"
+        assert _priority_window(100.0) == "Immediate"
+
 
 class TestActionSelection:
     def test_imbalance_diagnosis(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(diagnosis="Imbalance detected on drive end")
         resp = run(req)
         action_ids = [item.action_id for item in resp.plan_items]
         assert "ACT004" in action_ids  # Balance correction
 
     def test_bearing_diagnosis(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(diagnosis="Bearing defect BPFO pattern")
         resp = run(req)
         action_ids = [item.action_id for item in resp.plan_items]
@@ -134,14 +133,12 @@ class TestActionSelection:
         assert "ACT005" in action_ids  # Bearing replacement
 
     def test_misalignment_diagnosis(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(diagnosis="Misalignment coupling signature")
         resp = run(req)
         action_ids = [item.action_id for item in resp.plan_items]
         assert "ACT003" in action_ids  # Alignment check
 
     def test_high_priority_includes_shutdown(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(
             severity_score=1.0, confidence=1.0,
             criticality=1.0, urgency=1.0,
@@ -151,7 +148,6 @@ class TestActionSelection:
         assert resp.plan_items[0].action_id == "ACT008"  # Shutdown first
 
     def test_no_diagnosis_defaults_to_confirmation(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(
             severity_score=0.2, confidence=0.3,
             criticality=0.2, urgency=0.1,
@@ -161,14 +157,12 @@ class TestActionSelection:
         assert "ACT001" in action_ids  # Confirmation run
 
     def test_stem_matching_lubric(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(diagnosis="Lubrication deficit observed")
         resp = run(req)
         action_ids = [item.action_id for item in resp.plan_items]
         assert "ACT002" in action_ids
 
     def test_deduplication(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         # "bearing" maps to ACT002 + ACT005, should not duplicate
         req = _make_request(diagnosis="bearing bearing bearing")
         resp = run(req)
@@ -178,13 +172,11 @@ class TestActionSelection:
 
 class TestResponseShape:
     def test_total_actions_matches(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request(diagnosis="bearing defect")
         resp = run(req)
         assert resp.total_actions == len(resp.plan_items)
 
     def test_plan_item_fields(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request()
         resp = run(req)
         item = resp.plan_items[0]
@@ -197,7 +189,28 @@ class TestResponseShape:
         assert item.verification
 
     def test_execution_time_present(self):
-        from rapid_ai_engine.modules.moduleE_maintenance import run
         req = _make_request()
         resp = run(req)
         assert resp.execution_time_ms >= 0
+
+
+class TestBatch:
+    def test_run_batch_matches_run(self):
+        requests = [
+            _make_request(),
+            _make_request(severity_score=1.0, confidence=1.0, criticality=1.0, urgency=1.0,
+                          safety_flag=True, diagnosis="bearing lubrication"),
+            _make_request(spares_ready=False, manpower_ready=False, diagnosis="misalignment"),
+            _make_request(severity_score=-0.5, confidence=0.0, criticality=0.0, urgency=0.0),
+        ]
+        for got, request in zip(run_batch(requests), requests):
+            want = run(request)
+            assert got.model_dump(exclude={"execution_time_ms"}) == \
+                want.model_dump(exclude={"execution_time_ms"})
+
+    def test_response_is_frozen(self):
+        resp = run(_make_request())
+        with pytest.raises(ValidationError):
+            resp.total_actions = 0
+        with pytest.raises(ValidationError):
+            resp.plan_items[0].rank = 2
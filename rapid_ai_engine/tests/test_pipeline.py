@@ -1,5 +1,12 @@
 """Integration tests for full RAPID AI pipeline."""
+import math
+import uuid
 import numpy as np
+import pytest
+from rapid_ai_engine.main import _clamp01, _next_trace_id, _TRACE_ID_BATCH
+
+# Elevated, noisy velocity signal (mean 8 mm/s at the failure threshold)
+_CRITICAL_VALUES = (8.0 + 2.0 * np.random.default_rng(42).standard_normal(300)).tolist()
 
 
 class TestFullPipeline:
@@ -18,10 +25,10 @@ class TestFullPipeline:
         assert resp.status_code == 200
         data = resp.json()
         assert data["health_stage"] == "Blocked"
+        assert data["module_trace"]["module0"]["metrics"]["rms"] == 1.0
+        assert data["module_trace"]["moduleA"] is None
 
     def test_critical_scenario(self, client):
-        np.random.seed(42)
-        values = (8.0 + 2.0 * np.random.randn(300)).tolist()
         req = {
             "schema_version": "1.0",
             "asset_id": "CRIT-001",
@@ -34,7 +41,7 @@ class TestFullPipeline:
             "signal": {
                 "signal_type": "velocity", "direction": "H",
                 "unit": "mm/s", "sampling_rate_hz": 6400,
-                "values": values,
+                "values": _CRITICAL_VALUES,
             },
         }
         resp = client.post("/rapid-ai/evaluate", json=req)
@@ -59,3 +66,26 @@ class TestFullPipeline:
         sample_request["criticality"] = 1.5
         resp = client.post("/rapid-ai/evaluate", json=sample_request)
         assert resp.status_code == 400
+
+
+class TestConfidenceClamp:
+    @pytest.mark.parametrize("value", [-3.0, -0.0, 0.0, 0.4, 1.0, 7.5, math.inf, -math.inf, math.nan])
+    def test_matches_min_max(self, value):
+        expected = min(1.0, max(0.0, value))
+        got = _clamp01(value)
+        assert got == expected
+        assert math.copysign(1.0, got) == math.copysign(1.0, expected)
+
+
+class TestTraceId:
+    def test_generated_trace_ids_are_unique_uuid4(self):
+        ids = [_next_trace_id() for _ in range(_TRACE_ID_BATCH + 5)]
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(i).version == 4 for i in ids)
+
+    def test_trace_id_echoed_or_generated(self, client, sample_request):
+        data = client.post("/rapid-ai/evaluate", json=sample_request).json()
+        assert data["trace_id"]
+        sample_request["trace_id"] = "caller-trace"
+        data = client.post("/rapid-ai/evaluate", json=sample_request).json()
+        assert data["trace_id"] == "caller-trace"
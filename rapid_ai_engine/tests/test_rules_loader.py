@@ -1,6 +1,7 @@
 """Tests for YAML rule loader."""
-import pytest
-from rapid_ai_engine.rules.loader import load_actions, load_profiles, load_block_scores
+from rapid_ai_engine.rules.loader import (
+    load_actions, load_actions_compiled, load_profiles, load_block_scores,
+)
 
 
 class TestLoadActions:
@@ -20,6 +21,16 @@ class TestLoadActions:
         actions = load_actions()
         assert "diagnosis_map" in actions
 
+    def test_compiled_matches_catalog(self):
+        actions = load_actions()
+        compiled = load_actions_compiled()
+        assert [k for k, _ in compiled.diagnosis_items] == \
+            [k.lower() for k in actions["diagnosis_map"]]
+        assert "diagnosis_map" not in compiled.actions
+        title, justification, verification = compiled.actions["ACT001"]
+        assert title == actions["ACT001"]["title"]
+        assert verification == actions["ACT001"]["verification"]
+
 
 class TestLoadProfiles:
     def test_loads_pump_profile(self):